@@ -10,9 +10,6 @@ This application provides a user-friendly interface for:
 Run with: streamlit run app.py
 """
 
-import asyncio
-from datetime import datetime
-
 import streamlit as st
 
 from src.loaders.document_loader import EmptyDocumentError, InvalidFileError
@@ -20,20 +17,30 @@ from src.utils.logging_config import get_logger, setup_logging
 from streamlit_ui import (
     COLORS,
     MAX_FILE_SIZE_MB,
+    discard_staged_file,
     display_follow_up_questions,
+    display_header,
     display_loading_spinner,
     display_metadata,
+    display_sidebar,
     display_sources_section,
     display_summary,
+    display_upload_prompt,
     export_to_json,
     get_custom_css,
+    get_export_filename,
     process_document,
+    stage_uploaded_file,
+    submit_async,
     validate_uploaded_file,
 )
 
 setup_logging()
 logger = get_logger(__name__)
 
+# How often the processing screen checks for a new stage or a finished extraction
+PROGRESS_POLL_SECONDS = 0.5
+
 # Debug mode - show errors in-app
 DEBUG_MODE = False
 
@@ -46,73 +53,70 @@ st.set_page_config(
 )
 
 # Apply custom CSS
-st.markdown(get_custom_css(), unsafe_allow_html=True)
+st.html(get_custom_css())
+
+
+@st.fragment(run_every=PROGRESS_POLL_SECONDS)
+def poll_extraction():
+    """Show extraction progress and pick up the result when it is ready.
+
+    Runs as a fragment refreshed every PROGRESS_POLL_SECONDS. Each tick only
+    checks whether the background extraction has finished, never waiting on
+    it, so the script thread stays free while the pipeline runs on the
+    background event loop. A rerun mid-way picks the same extraction back up
+    instead of losing it.
+    """
+    state = st.session_state
+    future, progress = state.extraction
+    if not future.done():
+        display_loading_spinner(progress["stage"])
+        return
+
+    state.extraction = None
+    state.processing = False
+    try:
+        state.result = future.result()
+        state.export_json = None
+
+    except InvalidFileError as e:
+        state.error_message = "**Invalid File**\n\nThe uploaded file is not a valid Word document. Please upload a .docx file."
+        logger.error(f"Invalid file: {e}")
+
+    except EmptyDocumentError as e:
+        state.error_message = (
+            "**Empty Document**\n\nThe document contains no usable text content."
+        )
+        logger.error(f"Empty document: {e}")
+
+    except Exception as e:
+        state.error_message = "**Processing Error**\n\nAn unexpected error occurred. Please try again or contact support."
+        logger.error(f"Error processing: {e}", exc_info=True)
+
+    st.rerun()
 
 
 def main():
     """Main application entry point."""
-    # Initialize session state
-    if "result" not in st.session_state:
-        st.session_state.result = None
-    if "processing" not in st.session_state:
-        st.session_state.processing = False
-    if "error_message" not in st.session_state:
-        st.session_state.error_message = None
-
-    # Header
-    st.markdown(
-        """
-    <div class="main-header">
-        <h1>Palindrome Wealth Intelligence</h1>
-        <p>Precision extraction for discerning wealth management</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    # Minimal sidebar - clean branding only
-    with st.sidebar:
-        st.markdown(
-            f"""
-        <div style="padding: 1.5rem 0;">
-            <div style="font-size: 1.25rem; font-weight: 600; color: {COLORS["text_primary"]}; letter-spacing: -0.025em;">
-                Palindrome
-            </div>
-            <div style="font-size: 0.7rem; color: {COLORS["text_muted"]}; margin-top: 0.25rem; text-transform: uppercase; letter-spacing: 0.1em;">
-                Source of Wealth
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    # Bind once; session state is read and written throughout each rerun
+    state = st.session_state
 
-        # Minimal info - expandable for those who want details
-        with st.expander("About this tool", expanded=False):
-            st.markdown(
-                f"""
-            <div style="color: {COLORS["text_secondary"]}; font-size: 0.8rem; line-height: 1.7;">
-                Automated extraction of wealth source information from client narratives.
-                <br/><br/>
-                <span style="color: {COLORS["text_muted"]};">Supported format:</span> .docx (max {MAX_FILE_SIZE_MB}MB)
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    # Initialize session state
+    if "result" not in state:
+        state.result = None
+    if "processing" not in state:
+        state.processing = False
+    if "error_message" not in state:
+        state.error_message = None
+    if "export_json" not in state:
+        state.export_json = None
+        state.export_filename = None
+
+    display_header()
+    display_sidebar()
 
     # Show upload section only when not processing and no results
-    if not st.session_state.processing and st.session_state.result is None:
-        st.markdown(
-            '<div class="section-header">Upload Document</div>', unsafe_allow_html=True
-        )
-
-        st.markdown(
-            f"""
-        <div style="color: {COLORS["text_secondary"]}; font-size: 0.9rem; margin-bottom: 1rem;">
-            Upload a Word document containing the client's source of wealth narrative.
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    if not state.processing and state.result is None:
+        display_upload_prompt()
 
         uploaded_file = st.file_uploader(
             "Choose file",
@@ -123,11 +127,20 @@ def main():
         )
 
         if uploaded_file is not None:
-            st.session_state.error_message = None
-            is_valid, error_message = validate_uploaded_file(uploaded_file)
+            state.error_message = None
+            # Validate each upload once; a rejected file stays in the uploader
+            # and would otherwise be re-checked on every rerun
+            validation = state.get("upload_validation")
+            if validation is None or validation[0] != uploaded_file.file_id:
+                validation = (
+                    uploaded_file.file_id,
+                    *validate_uploaded_file(uploaded_file),
+                )
+                state.upload_validation = validation
+            _, is_valid, error_message = validation
 
             if not is_valid:
-                st.markdown(
+                st.html(
                     f"""
                 <div class="alert-box alert-error">
                     <div>
@@ -136,82 +149,72 @@ def main():
                     </div>
                 </div>
                 """,
-                    unsafe_allow_html=True,
                 )
             else:
                 # Auto-trigger processing immediately
-                st.session_state.processing = True
-                st.session_state.pending_file = uploaded_file.read()
-                st.session_state.pending_filename = uploaded_file.name
+                # Keep only a temp file handle in session state, not the bytes
+                pending_path, pending_digest = stage_uploaded_file(uploaded_file)
+                state.processing = True
+                state.pending_path = pending_path
+                state.pending_digest = pending_digest
+                state.pending_filename = uploaded_file.name
                 st.rerun()
 
     # Processing state with CSS-animated loading messages
-    elif st.session_state.processing:
-        # Display the loading spinner
-        display_loading_spinner()
-
-        # If we have a pending file, process it
-        if (
-            hasattr(st.session_state, "pending_file")
-            and st.session_state.pending_file is not None
-        ):
-            file_bytes = st.session_state.pending_file
-            filename = st.session_state.pending_filename
+    elif state.processing:
+        # If we have a pending file, start processing it in the background
+        if state.get("pending_path") is not None:
+            file_path = state.pending_path
+            digest = state.pending_digest
+            filename = state.pending_filename
 
             # Clear pending file
-            st.session_state.pending_file = None
-            st.session_state.pending_filename = None
+            state.pending_path = None
+            state.pending_digest = None
+            state.pending_filename = None
 
-            try:
-                result = asyncio.run(process_document(file_bytes, filename))
-                st.session_state.result = result
-                st.session_state.processing = False
-                st.rerun()
+            # Written from the event loop thread, read back by poll_extraction
+            progress = {"stage": None}
 
-            except InvalidFileError as e:
-                st.session_state.error_message = "**Invalid File**\n\nThe uploaded file is not a valid Word document. Please upload a .docx file."
-                logger.error(f"Invalid file: {e}")
-                st.session_state.processing = False
-                st.rerun()
+            def on_progress(stage: str) -> None:
+                progress["stage"] = stage
 
-            except EmptyDocumentError as e:
-                st.session_state.error_message = "**Empty Document**\n\nThe document contains no usable text content."
-                logger.error(f"Empty document: {e}")
-                st.session_state.processing = False
-                st.rerun()
+            future = submit_async(
+                process_document(file_path, filename, digest, on_progress)
+            )
+            future.add_done_callback(lambda _: discard_staged_file(file_path))
+            state.extraction = (future, progress)
 
-            except Exception as e:
-                st.session_state.error_message = "**Processing Error**\n\nAn unexpected error occurred. Please try again or contact support."
-                logger.error(f"Error processing: {e}", exc_info=True)
-                st.session_state.processing = False
-                st.rerun()
+        if state.get("extraction") is not None:
+            poll_extraction()
         else:
             # Fallback - reset state if no pending file
-            st.session_state.processing = False
+            state.processing = False
             st.rerun()
 
     # Display error with option to try again
-    if st.session_state.error_message:
-        st.error(st.session_state.error_message)
+    if state.error_message:
+        st.error(state.error_message)
         if st.button("Try Again", use_container_width=False):
-            st.session_state.error_message = None
+            state.error_message = None
             st.rerun()
 
     # Display results
-    if st.session_state.result is not None:
+    if state.result is not None:
         # New document button at top
         col1, col2, col3 = st.columns([1, 1, 4])
         with col1:
             if st.button("New Document", use_container_width=True):
-                st.session_state.result = None
-                st.session_state.error_message = None
+                state.result = None
+                state.export_json = None
+                state.export_filename = None
+                state.error_message = None
                 st.rerun()
         try:
-            result = st.session_state.result
+            result = state.result
 
-            st.markdown(
-                f"<hr style='border-color: {COLORS['border']}; margin: 2rem 0;'/>",
-                unsafe_allow_html=True,
+            st.html(
+                f"<hr style='border-color: {COLORS.border}; margin: 2rem 0;'/>",
             )
 
             display_metadata(result)
@@ -220,16 +223,14 @@ def main():
             display_follow_up_questions(result)
 
             # Export section
-            st.markdown(
-                '<div class="section-header">Export</div>', unsafe_allow_html=True
-            )
+            st.html('<div class="section-header">Export</div>')
 
-            json_output = export_to_json(result)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            account_name = result.metadata.account_holder.name.replace(
-                " ", "_"
-            ).replace(",", "")
-            filename = f"sow_{account_name}_{timestamp}.json"
+            # Serialise and encode once per result rather than on every rerun
+            if state.export_json is None:
+                state.export_json = export_to_json(result).encode("utf-8")
+                state.export_filename = get_export_filename(result)
+            json_output = state.export_json
+            filename = state.export_filename
 
             col1, col2 = st.columns([1, 3])
             with col1:
@@ -241,13 +242,12 @@ def main():
                     use_container_width=True,
                 )
 
-            st.markdown(
+            st.html(
                 f"""
-            <div style="color: {COLORS["text_muted"]}; font-size: 0.8rem; margin-top: 0.5rem;">
+            <div style="color: {COLORS.text_muted}; font-size: 0.8rem; margin-top: 0.5rem;">
                 {len(json_output):,} bytes
             </div>
             """,
-                unsafe_allow_html=True,
             )
 
         except Exception as e:
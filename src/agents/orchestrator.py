@@ -1,6 +1,7 @@
 """Orchestrator agent coordinating all SOW extraction agents."""
 
 import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from src.agents.sow import (
@@ -47,6 +48,57 @@ from src.utils.validation import (
 
 logger = get_logger(__name__)
 
+# Receives a short human-readable description of the current pipeline stage
+ProgressCallback = Callable[[str], None]
+
+# Markers on the placeholder result returned when extraction fails
+FAILED_EXTRACTION_NAME = "Unknown (extraction failed)"
+FAILED_EXTRACTION_CURRENCY = "ERROR"
+
+
+def failed_extraction_result() -> ExtractionResult:
+    """Build the placeholder result returned when the pipeline fails.
+
+    Returns:
+        An empty ExtractionResult flagged with the failure markers
+    """
+    return ExtractionResult(
+        metadata=ExtractionMetadata(  # type: ignore[call-arg]
+            account_holder=AccountHolder(  # type: ignore[call-arg]
+                name=FAILED_EXTRACTION_NAME,
+                type=AccountType.INDIVIDUAL,
+            ),
+            total_stated_net_worth=None,
+            currency=FAILED_EXTRACTION_CURRENCY,
+        ),
+        sources_of_wealth=[],
+        summary=ExtractionSummary(
+            total_sources_identified=0,
+            fully_complete_sources=0,
+            sources_with_missing_fields=0,
+            overall_completeness_score=0.0,
+        ),
+        recommended_follow_up_questions=[
+            "Extraction failed. Please verify the document format and try again."
+        ],
+    )
+
+
+def is_failed_extraction(result: ExtractionResult) -> bool:
+    """Check whether a result is the failure placeholder.
+
+    Args:
+        result: Result returned by Orchestrator.process
+
+    Returns:
+        True if the pipeline failed and the result holds no extracted data
+    """
+    metadata = result.metadata
+    return (
+        metadata.currency == FAILED_EXTRACTION_CURRENCY
+        and metadata.account_holder.name == FAILED_EXTRACTION_NAME
+    )
+
 
 class Orchestrator:
     """Main orchestrator for SOW extraction process."""
@@ -536,19 +588,27 @@ class Orchestrator:
 
         return sources, all_evidence
 
-    async def process(self, narrative: str) -> ExtractionResult:
+    async def process(
+        self, narrative: str, on_progress: ProgressCallback | None = None
+    ) -> ExtractionResult:
         """Process a narrative and extract all SOW information.
 
         Args:
             narrative: Client narrative text
+            on_progress: Optional callback notified as each pipeline stage starts
 
         Returns:
             Complete ExtractionResult with metadata, sources, and summary
         """
         logger.info("Starting SOW extraction process...")
 
+        def report(stage: str) -> None:
+            if on_progress is not None:
+                on_progress(stage)
+
         try:
             # Step 1: Extract metadata FIRST (provides context for other agents)
+            report("Extracting account holder details...")
             metadata = await self.extract_metadata(narrative)
 
             # Step 2: Build context for SOW agents (entity awareness)
@@ -558,6 +618,7 @@ class Orchestrator:
             }
 
             # Step 3: Dispatch all agents in parallel with context
+            report("Identifying wealth sources...")
             agent_results = await self.dispatch_all_agents(narrative, context=context)
 
             # Step 4: Merge results and assign source_ids
@@ -571,6 +632,7 @@ class Orchestrator:
 
             # 5b: LLM validation - fix flagged fields only (if any issues found)
             if validation_issues:
+                report("Validating extracted fields...")
                 logger.info(
                     f"Found {len(validation_issues)} validation issues, "
                     "running LLM validation..."
@@ -581,11 +643,13 @@ class Orchestrator:
                 sources = apply_corrections(sources, corrections)
 
             # Step 6: Field Search Agent - find missing required fields
+            report("Searching for missing information...")
             sources, search_evidence = await self._search_missing_fields(
                 narrative, sources
             )
 
             # Step 7: Deduplication - merge/remove duplicate sources
+            report("Cross-referencing source chains...")
             sources = deduplicate_sources(sources)
 
             # Step 8: Detect overlapping sources (same event, multiple sources)
@@ -595,6 +659,7 @@ class Orchestrator:
             summary = calculate_summary(sources)
 
             # Step 10: Generate follow-up questions using dedicated agent
+            report("Generating follow-up questions...")
             # Create preliminary result for question generation
             preliminary_result = ExtractionResult(
                 metadata=metadata,
@@ -630,28 +695,7 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"Fatal error during extraction process: {e}", exc_info=True)
             # Return minimal result on catastrophic failure
-            default_metadata = ExtractionMetadata(  # type: ignore[call-arg]
-                account_holder=AccountHolder(  # type: ignore[call-arg]
-                    name="Unknown (extraction failed)",
-                    type=AccountType.INDIVIDUAL,
-                ),
-                total_stated_net_worth=None,
-                currency="ERROR",
-            )
-
-            return ExtractionResult(
-                metadata=default_metadata,
-                sources_of_wealth=[],
-                summary=ExtractionSummary(
-                    total_sources_identified=0,
-                    fully_complete_sources=0,
-                    sources_with_missing_fields=0,
-                    overall_completeness_score=0.0,
-                ),
-                recommended_follow_up_questions=[
-                    "Extraction failed. Please verify the document format and try again."
-                ],
-            )
+            return failed_extraction_result()
 
     def _generate_follow_up_questions(self, sources: list[SourceOfWealth]) -> list[str]:
         """Generate follow-up questions based on missing fields - Fallback method.
@@ -8,6 +8,7 @@ Model Tiering Strategy:
 - Simple agents: openai:gpt-4.1-mini (better instruction following, cost-effective), some are 4.1 due to complexity
 - Complex agents: openai:o3-mini (native reasoning for entity relationships)
 - Validation agent: openai:o3-mini with high reasoning effort
+- Field equivalence checks in run_extraction.py --llm-eval: openai:gpt-4.1-nano
 """
 
 from enum import StrEnum
@@ -19,6 +20,7 @@ from pydantic import BaseModel
 class ModelName(StrEnum):
     """Available model names for agents."""
 
+    GPT_4_1_NANO = "openai:gpt-4.1-nano"
     GPT_4_1_MINI = "openai:gpt-4.1-mini"
     GPT_4_1 = "openai:gpt-4.1"
     O3_MINI = "openai:o3-mini"
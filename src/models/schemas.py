@@ -1,5 +1,6 @@
 """Pydantic models for SOW extraction output schema."""
 
+from datetime import datetime
 from enum import StrEnum
 
 from pydantic import BaseModel, Field
@@ -572,6 +573,11 @@ class ExtractionMetadata(BaseModel):
         None, description="Total stated net worth"
     )
     currency: str = Field(default="GBP", description="Currency code")
+    extracted_at: datetime = Field(
+        default_factory=datetime.now,
+        exclude=True,
+        description="When the extraction was produced (not part of the output schema)",
+    )
 
 
 class ExtractionSummary(BaseModel):
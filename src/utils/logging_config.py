@@ -3,12 +3,47 @@
 import logging
 import os
 import sys
+from contextvars import ContextVar, Token
 from pathlib import Path
 
 
 # Track run-specific file handlers so we can remove them later
 _run_file_handlers: list[logging.FileHandler] = []
 
+# Label for the unit of work being logged (e.g. the case name). Context
+# variables follow asyncio tasks, so concurrent cases stay attributable.
+_log_context: ContextVar[str] = ContextVar("log_context", default="")
+
+
+class _LogContextFilter(logging.Filter):
+    """Expose the current log context label to formatters as %(log_context)s."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        label = _log_context.get()
+        record.log_context = f"[{label}] " if label else ""
+        return True
+
+
+def set_log_context(label: str) -> Token[str]:
+    """Label log records from the current task (and tasks it starts).
+
+    Args:
+        label: Label to prefix run-log messages with (e.g. the case name)
+
+    Returns:
+        Token that restores the previous label via reset_log_context
+    """
+    return _log_context.set(label)
+
+
+def reset_log_context(token: Token[str]) -> None:
+    """Restore the log context label that was active before set_log_context.
+
+    Args:
+        token: The token returned by set_log_context
+    """
+    _log_context.reset(token)
+
 
 def setup_logging() -> None:
     """Configure logging for the application."""
@@ -49,12 +84,15 @@ def add_run_file_handler(run_dir: Path) -> logging.FileHandler:
     """
     log_path = run_dir / "extraction.log"
 
-    # Create handler with same format as console
+    # Create handler with the console format, plus the log context label
     handler = logging.FileHandler(log_path, encoding="utf-8")
     handler.setLevel(logging.DEBUG)  # Capture everything including DEBUG
     handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(log_context)s%(message)s"
+        )
     )
+    handler.addFilter(_LogContextFilter())
 
     # Add to root logger
     logging.getLogger().addHandler(handler)
@@ -2,19 +2,30 @@
 
 from .components import (
     display_follow_up_questions,
+    display_header,
     display_loading_spinner,
     display_metadata,
     display_source,
+    display_sidebar,
     display_sources_section,
     display_summary,
+    display_upload_prompt,
 )
 from .helpers import (
     ALLOWED_EXTENSIONS,
     MAX_FILE_SIZE_MB,
+    discard_staged_file,
     export_to_json,
     get_completeness_color,
+    get_completeness_display,
+    get_event_loop,
+    get_orchestrator,
+    get_export_filename,
     get_status_class,
     process_document,
+    run_async,
+    stage_uploaded_file,
+    submit_async,
     validate_uploaded_file,
 )
 from .styles import COLORS, get_custom_css, get_loading_animation_css
@@ -25,6 +36,9 @@ __all__ = [
     "get_custom_css",
     "get_loading_animation_css",
     # Components
+    "display_header",
+    "display_sidebar",
+    "display_upload_prompt",
     "display_metadata",
     "display_summary",
     "display_source",
@@ -33,10 +47,18 @@ __all__ = [
     "display_loading_spinner",
     # Helpers
     "get_completeness_color",
+    "get_completeness_display",
     "get_status_class",
     "validate_uploaded_file",
     "export_to_json",
+    "get_export_filename",
     "process_document",
+    "get_event_loop",
+    "get_orchestrator",
+    "run_async",
+    "submit_async",
+    "stage_uploaded_file",
+    "discard_staged_file",
     "MAX_FILE_SIZE_MB",
     "ALLOWED_EXTENSIONS",
 ]
@@ -3,16 +3,153 @@
 Display functions for metadata, summaries, sources, and questions.
 """
 
-from collections import defaultdict
-from datetime import datetime
+from collections.abc import Callable
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
 
 import streamlit as st
 
 from src.models.schemas import ExtractionResult, SourceOfWealth
 
-from .helpers import get_completeness_color, get_status_class
+from .helpers import MAX_FILE_SIZE_MB, get_completeness_display
 from .styles import COLORS, get_loading_animation_css
 
+# Static markup is rendered once at import; app.py is re-executed on every
+# rerun, so anything built there would be rebuilt each time.
+_HEADER_HTML = """
+    <div class="main-header">
+        <h1>Palindrome Wealth Intelligence</h1>
+        <p>Precision extraction for discerning wealth management</p>
+    </div>
+    """
+
+_SIDEBAR_BRAND_HTML = f"""
+        <div style="padding: 1.5rem 0;">
+            <div style="font-size: 1.25rem; font-weight: 600; color: {COLORS.text_primary}; letter-spacing: -0.025em;">
+                Palindrome
+            </div>
+            <div style="font-size: 0.7rem; color: {COLORS.text_muted}; margin-top: 0.25rem; text-transform: uppercase; letter-spacing: 0.1em;">
+                Source of Wealth
+            </div>
+        </div>
+        """
+
+_SIDEBAR_ABOUT_HTML = f"""
+            <div style="color: {COLORS.text_secondary}; font-size: 0.8rem; line-height: 1.7;">
+                Automated extraction of wealth source information from client narratives.
+                <br/><br/>
+                <span style="color: {COLORS.text_muted};">Supported format:</span> .docx (max {MAX_FILE_SIZE_MB}MB)
+            </div>
+            """
+
+_UPLOAD_PROMPT_HTML = f"""
+        <div style="color: {COLORS.text_secondary}; font-size: 0.9rem; margin-bottom: 1rem;">
+            Upload a Word document containing the client's source of wealth narrative.
+        </div>
+        """
+
+
+def display_header() -> None:
+    """Display the application header."""
+    st.html(_HEADER_HTML)
+
+
+def display_sidebar() -> None:
+    """Display the sidebar branding and about section."""
+    with st.sidebar:
+        st.html(_SIDEBAR_BRAND_HTML)
+
+        # Minimal info - expandable for those who want details
+        with st.expander("About this tool", expanded=False):
+            st.html(_SIDEBAR_ABOUT_HTML)
+
+
+def display_upload_prompt() -> None:
+    """Display the upload section header and instructions."""
+    st.html('<div class="section-header">Upload Document</div>')
+    st.html(_UPLOAD_PROMPT_HTML)
+
+
+def _metric_card(label: str, value: str, subtitle: str, value_style: str = "") -> str:
+    """Render a single metric card as HTML."""
+    style_attr = f' style="{value_style}"' if value_style else ""
+    return (
+        f'<div class="metric-card">'
+        f'<div class="metric-label">{label}</div>'
+        f'<div class="metric-value"{style_attr}>{value}</div>'
+        f"{subtitle}"
+        f"</div>"
+    )
+
+
+def _metric_grid(cards: list[str]) -> str:
+    """Lay out metric cards in equal-width columns within one HTML block."""
+    return (
+        f'<div class="metric-grid" style="grid-template-columns: '
+        f'repeat({len(cards)}, minmax(0, 1fr));">{"".join(cards)}</div>'
+    )
+
+
+def _get_section_html(
+    result: ExtractionResult, section: str, render: Callable[[ExtractionResult], str]
+) -> str:
+    """Return a section's HTML for a result, rendering it at most once.
+
+    Rendered sections are kept in session state alongside the result they
+    were built from, so reruns triggered by widgets elsewhere on the page
+    re-emit the cached markup instead of rebuilding it.
+    """
+    cached = st.session_state.get("_section_html")
+    if cached is None or cached[0] is not result:
+        cached = (result, {})
+        st.session_state["_section_html"] = cached
+    sections: dict[str, str] = cached[1]
+    if section not in sections:
+        sections[section] = render(result)
+    return sections[section]
+
+
+_CURRENCY_SYMBOLS = MappingProxyType(
+    {"GBP": "£", "USD": "$", "EUR": "€", "AED": "AED "}
+)
+
+
+def _render_metadata_html(result: ExtractionResult) -> str:
+    """Build the account information section as a single HTML string."""
+    metadata = result.metadata
+
+    if metadata.total_stated_net_worth:
+        currency = metadata.currency or "GBP"
+        symbol = _CURRENCY_SYMBOLS.get(currency, f"{currency} ")
+        worth_str = f"{symbol}{metadata.total_stated_net_worth:,.0f}"
+    else:
+        worth_str = "Not Disclosed"
+
+    case_id = metadata.case_id or "—"
+    extraction_date = metadata.extracted_at.strftime("%d %b %Y")
+
+    cards = [
+        _metric_card(
+            "Account Holder",
+            metadata.account_holder.name,
+            f'<div class="metric-subtitle">{metadata.account_holder.type.value.title()} Account</div>',
+        ),
+        _metric_card(
+            "Stated Net Worth",
+            worth_str,
+            '<div class="metric-subtitle">As declared in narrative</div>',
+        ),
+        _metric_card(
+            "Case Reference",
+            case_id,
+            f'<div class="metric-subtitle">Extracted {extraction_date}</div>',
+        ),
+    ]
+    return (
+        f'<div class="section-header">Account Information</div>\n{_metric_grid(cards)}'
+    )
+
 
 def display_metadata(result: ExtractionResult) -> None:
     """Display extraction metadata in professional cards.
@@ -20,58 +157,73 @@ def display_metadata(result: ExtractionResult) -> None:
     Args:
         result: The extraction result containing metadata
     """
-    st.markdown(
-        '<div class="section-header">Account Information</div>', unsafe_allow_html=True
+    st.html(
+        _get_section_html(result, "metadata", _render_metadata_html),
     )
 
-    col1, col2, col3 = st.columns(3)
 
-    with col1:
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Account Holder</div>
-            <div class="metric-value">{result.metadata.account_holder.name}</div>
-            <div class="metric-subtitle">{result.metadata.account_holder.type.value.title()} Account</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+def _render_summary_html(result: ExtractionResult) -> str:
+    """Build the extraction summary dashboard as a single HTML string."""
+    summary = result.summary
+    parts = ['<div class="section-header">Extraction Summary</div>']
 
-    with col2:
-        if result.metadata.total_stated_net_worth:
-            currency = result.metadata.currency or "GBP"
-            symbols = {"GBP": "£", "USD": "$", "EUR": "€", "AED": "AED "}
-            symbol = symbols.get(currency, f"{currency} ")
-            worth_str = f"{symbol}{result.metadata.total_stated_net_worth:,.0f}"
-        else:
-            worth_str = "Not Disclosed"
-
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Stated Net Worth</div>
-            <div class="metric-value">{worth_str}</div>
-            <div class="metric-subtitle">As declared in narrative</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    # Missing fields summary at top. Counted here rather than stored on the
+    # summary, which must match the output schema; the section HTML is cached,
+    # so this runs once per result
+    total_missing = sum(len(s.missing_fields) for s in result.sources_of_wealth)
+    if total_missing > 0:
+        incomplete = summary.sources_with_missing_fields
+        parts.append(
+            f'<div class="alert-box alert-warning" style="margin-bottom: 1.5rem;"><div>'
+            f'<div class="alert-title">Information Gaps Identified</div>'
+            f'<div class="alert-message">'
+            f"{total_missing} required field{'s' if total_missing != 1 else ''} missing "
+            f"across {incomplete} source{'s' if incomplete != 1 else ''}. "
+            f"Review each source below and use the follow-up questions to collect missing information."
+            f"</div></div></div>"
         )
 
-    with col3:
-        case_id = result.metadata.case_id or "—"
-        extraction_date = datetime.now().strftime("%d %b %Y")
+    score = summary.overall_completeness_score
+    score_color, status, status_class = get_completeness_display(score)
+    incomplete_color = (
+        COLORS.warning if summary.sources_with_missing_fields > 0 else COLORS.success
+    )
 
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Case Reference</div>
-            <div class="metric-value">{case_id}</div>
-            <div class="metric-subtitle">Extracted {extraction_date}</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    cards = [
+        _metric_card(
+            "Total Sources",
+            str(summary.total_sources_identified),
+            '<div class="metric-subtitle">Identified in document</div>',
+        ),
+        _metric_card(
+            "Complete",
+            str(summary.fully_complete_sources),
+            '<div class="metric-subtitle">All fields present</div>',
+            f"color: {COLORS.success};",
+        ),
+        _metric_card(
+            "Incomplete",
+            str(summary.sources_with_missing_fields),
+            '<div class="metric-subtitle">Require follow-up</div>',
+            f"color: {incomplete_color};",
+        ),
+        _metric_card(
+            "Completeness",
+            f"{score:.0%}",
+            f'<div style="margin-top: 0.5rem;">'
+            f'<span class="status-pill status-{status_class}">{status}</span></div>',
+            f"color: {score_color};",
+        ),
+    ]
+    parts.append(_metric_grid(cards))
+
+    # Progress bar
+    parts.append(
+        f'<div class="progress-container">'
+        f'<div class="progress-bar" style="width: {score * 100}%; background: {score_color};"></div>'
+        f"</div>"
+    )
+    return "\n".join(parts)
 
 
 def display_summary(result: ExtractionResult) -> None:
@@ -80,221 +232,234 @@ def display_summary(result: ExtractionResult) -> None:
     Args:
         result: The extraction result containing summary
     """
-    st.markdown(
-        '<div class="section-header">Extraction Summary</div>', unsafe_allow_html=True
+    st.html(
+        _get_section_html(result, "summary", _render_summary_html),
     )
 
-    # Missing fields summary at top
-    total_missing = sum(len(s.missing_fields) for s in result.sources_of_wealth)
-    if total_missing > 0:
-        st.markdown(
-            f"""
-        <div class="alert-box alert-warning" style="margin-bottom: 1.5rem;">
-            <div>
-                <div class="alert-title">Information Gaps Identified</div>
-                <div class="alert-message">
-                    {total_missing} required field{"s" if total_missing != 1 else ""} missing across {result.summary.sources_with_missing_fields} source{"s" if result.summary.sources_with_missing_fields != 1 else ""}. 
-                    Review each source below and use the follow-up questions to collect missing information.
-                </div>
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
 
-    col1, col2, col3, col4 = st.columns(4)
+# Row templates for source field lists (str.format, filled per field)
+_FIELD_PRESENT_TEMPLATE = (
+    '<div class="field-item field-present">'
+    '<div class="field-label">{label}</div>'
+    '<div class="field-value">{value}</div>'
+    "</div>"
+)
+_FIELD_MISSING_TEMPLATE = (
+    '<div class="field-item field-missing">'
+    '<div class="field-label">{label}{partial}</div>'
+    f'<div class="field-value" style="color: {COLORS.text_secondary};">{{reason}}</div>'
+    "</div>"
+)
+_PARTIAL_TAG_HTML = (
+    f" <span style='font-size: 0.7rem; color: {COLORS.warning};'>(Partial)</span>"
+)
+_COLUMN_TITLE_STYLE = (
+    f"font-size: 0.8rem; font-weight: 500; color: {COLORS.text_muted}; "
+    f"text-transform: uppercase; letter-spacing: 0.025em; margin-bottom: 0.75rem;"
+)
+_EXTRACTED_TITLE_HTML = (
+    f'<div style="{_COLUMN_TITLE_STYLE}">Extracted Information</div>'
+)
+_MISSING_TITLE_HTML = f'<div style="{_COLUMN_TITLE_STYLE}">Missing Information</div>'
+_FIELD_VALUE_MAX_LENGTH = 80
+_TYPE_HEADER_TEMPLATE = (
+    f'<div style="margin-top: 1.5rem; margin-bottom: 1rem; padding-bottom: 0.5rem; '
+    f'border-bottom: 1px solid {COLORS.border};">'
+    f'<div style="font-size: 0.9rem; font-weight: 600; color: {COLORS.text_primary}; '
+    f'text-transform: capitalize;">{{label}} ({{count}})</div>'
+    f"</div>"
+)
+
+
+def _truncate(value: str) -> str:
+    """Shorten long field values for display."""
+    if len(value) > _FIELD_VALUE_MAX_LENGTH:
+        return value[: _FIELD_VALUE_MAX_LENGTH - 3] + "..."
+    return value
+
+
+def _render_source_html(source: SourceOfWealth) -> str:
+    """Build the body of a source card as a single HTML string."""
+    score = source.completeness_score
+    color, status, status_class = get_completeness_display(score)
+    source_type_display = source.source_type.value.replace("_", " ").title()
 
-    with col1:
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Total Sources</div>
-            <div class="metric-value">{result.summary.total_sources_identified}</div>
-            <div class="metric-subtitle">Identified in document</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    # Header
+    parts = [
+        f'<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">'
+        f'<div><span style="font-size: 1rem; font-weight: 500; color: {COLORS.text_primary};">'
+        f"{source_type_display}</span></div>"
+        f'<span class="status-pill status-{status_class}">{status}</span>'
+        f"</div>"
+    ]
+
+    # Description
+    if source.description:
+        parts.append(
+            f'<div style="color: {COLORS.text_secondary}; font-size: 0.9rem; '
+            f"padding: 0.75rem 1rem; background: {COLORS.secondary}; "
+            f'border-radius: 6px; margin-bottom: 1rem;">{source.description}</div>'
         )
 
-    with col2:
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Complete</div>
-            <div class="metric-value" style="color: {COLORS["success"]};">{result.summary.fully_complete_sources}</div>
-            <div class="metric-subtitle">All fields present</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    # Progress
+    parts.append(
+        f'<div style="margin-bottom: 1.5rem;">'
+        f'<div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">'
+        f'<span style="font-size: 0.8rem; color: {COLORS.text_muted};">Completeness</span>'
+        f'<span style="font-size: 0.8rem; font-weight: 500; color: {color};">{score:.0%}</span>'
+        f"</div>"
+        f'<div class="progress-container">'
+        f'<div class="progress-bar" style="width: {score * 100}%; background: {color};"></div>'
+        f"</div></div>"
+    )
 
-    with col3:
-        color = (
-            COLORS["warning"]
-            if result.summary.sources_with_missing_fields > 0
-            else COLORS["success"]
-        )
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Incomplete</div>
-            <div class="metric-value" style="color: {color};">{result.summary.sources_with_missing_fields}</div>
-            <div class="metric-subtitle">Require follow-up</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    # Extracted fields
+    extracted_rows = [
+        _FIELD_PRESENT_TEMPLATE.format(
+            label=field_name.replace("_", " ").title(),
+            value=_truncate(str(value)),
         )
+        for field_name, value in source.extracted_fields.items()
+        if value
+    ]
+    extracted_html = (
+        _EXTRACTED_TITLE_HTML + "".join(extracted_rows)
+        if source.extracted_fields
+        else ""
+    )
 
-    with col4:
-        score = result.summary.overall_completeness_score
-        color, status = get_completeness_color(score)
-        status_class = get_status_class(score)
-
-        st.markdown(
-            f"""
-        <div class="metric-card">
-            <div class="metric-label">Completeness</div>
-            <div class="metric-value" style="color: {color};">{score:.0%}</div>
-            <div style="margin-top: 0.5rem;">
-                <span class="status-pill status-{status_class}">{status}</span>
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    # Missing fields
+    missing_rows = [
+        _FIELD_MISSING_TEMPLATE.format(
+            label=missing_field.field_name.replace("_", " ").title(),
+            partial=_PARTIAL_TAG_HTML if missing_field.partially_answered else "",
+            reason=missing_field.reason,
         )
+        for missing_field in source.missing_fields
+    ]
+    missing_html = (
+        _MISSING_TITLE_HTML + "".join(missing_rows) if source.missing_fields else ""
+    )
 
-    # Progress bar
-    score = result.summary.overall_completeness_score
-    color, _ = get_completeness_color(score)
-    st.markdown(
-        f"""
-    <div class="progress-container">
-        <div class="progress-bar" style="width: {score * 100}%; background: {color};"></div>
-    </div>
-    """,
-        unsafe_allow_html=True,
+    parts.append(
+        f'<div class="source-columns">'
+        f"<div>{extracted_html}</div>"
+        f"<div>{missing_html}</div>"
+        f"</div>"
+    )
+    return "".join(parts)
+
+
+def _build_source_card(source: SourceOfWealth) -> str:
+    """Wrap a source's body in a collapsible <details> card.
+
+    Expanding or collapsing is handled by the browser, so it doesn't cost a
+    Streamlit round-trip. Sources below the complete band start open.
+    """
+    score = source.completeness_score
+    source_type_display = source.source_type.value.replace("_", " ").title()
+    open_attr = " open" if score < 0.8 else ""
+    return (
+        f'<details class="source-card"{open_attr}>'
+        f'<summary class="source-header"><span class="source-title">'
+        f"{source.source_id} · {source_type_display} · {score:.0%}</span></summary>"
+        f'<div class="source-body">{_render_source_html(source)}</div>'
+        f"</details>"
     )
 
 
-def display_source(source: SourceOfWealth, index: int) -> None:
+def _get_source_cards(result: ExtractionResult) -> dict[int, str]:
+    """Return prebuilt source card HTML for a result, keyed by id(source).
+
+    Cards are built once per result and kept in session state, so reruns
+    (e.g. filter changes) reuse them instead of re-rendering.
+    """
+    cached = st.session_state.get("_source_cards")
+    if cached is None or cached[0] is not result:
+        cards = {
+            id(source): _build_source_card(source)
+            for source in result.sources_of_wealth
+        }
+        # Holding the result keeps the id() keys valid for the cache lifetime
+        cached = (result, cards)
+        st.session_state["_source_cards"] = cached
+    return cached[1]
+
+
+def display_source(source: SourceOfWealth) -> None:
     """Display a single source of wealth.
 
+    The card is emitted as one HTML block rather than one element per field.
+
     Args:
         source: The source of wealth to display
-        index: Index number for display purposes
     """
-    score = source.completeness_score
-    color, status = get_completeness_color(score)
-    status_class = get_status_class(score)
+    st.html(_build_source_card(source))
 
-    source_type_display = source.source_type.value.replace("_", " ").title()
-    title = f"{source.source_id} · {source_type_display} · {score:.0%}"
-
-    with st.expander(title, expanded=(score < 0.8)):
-        # Header
-        st.markdown(
-            f"""
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-            <div>
-                <span style="font-size: 1rem; font-weight: 500; color: {COLORS["text_primary"]};">
-                    {source_type_display}
-                </span>
-            </div>
-            <span class="status-pill status-{status_class}">{status}</span>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
 
-        # Description
-        if source.description:
-            st.markdown(
-                f"""
-            <div style="color: {COLORS["text_secondary"]}; font-size: 0.9rem; 
-                        padding: 0.75rem 1rem; background: {COLORS["secondary"]}; 
-                        border-radius: 6px; margin-bottom: 1rem;">
-                {source.description}
-            </div>
-            """,
-                unsafe_allow_html=True,
+_SOURCE_TYPE = attrgetter("source_type")
+_SOURCES_SHOWN_PER_TYPE = 10
+
+
+def _render_sources_html(result: ExtractionResult, filter_option: str) -> str:
+    """Build the filtered source listing, grouped by type, as one HTML string."""
+    source_cards = _get_source_cards(result)
+
+    visible = result.sources_of_wealth
+    if filter_option == "Incomplete":
+        visible = [s for s in visible if s.completeness_score < 0.8]
+    elif filter_option == "Complete":
+        visible = [s for s in visible if s.completeness_score >= 0.8]
+
+    # Stable sort by type, so each group keeps the extraction order
+    parts = []
+    for source_type, group in groupby(
+        sorted(visible, key=_SOURCE_TYPE), key=_SOURCE_TYPE
+    ):
+        sources = list(group)
+        parts.append(
+            _TYPE_HEADER_TEMPLATE.format(
+                label=source_type.replace("_", " "), count=len(sources)
+            )
+        )
+        parts.extend(
+            source_cards[id(source)] for source in sources[:_SOURCES_SHOWN_PER_TYPE]
+        )
+        overflow = sources[_SOURCES_SHOWN_PER_TYPE:]
+        if overflow:
+            # The browser skips layout for closed <details> content
+            parts.append(
+                f'<details class="source-overflow">'
+                f"<summary>Show {len(overflow)} more</summary>"
+                f"{''.join(source_cards[id(source)] for source in overflow)}"
+                f"</details>"
             )
 
-        # Progress
-        st.markdown(
-            f"""
-        <div style="margin-bottom: 1.5rem;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
-                <span style="font-size: 0.8rem; color: {COLORS["text_muted"]};">Completeness</span>
-                <span style="font-size: 0.8rem; font-weight: 500; color: {color};">{score:.0%}</span>
-            </div>
-            <div class="progress-container">
-                <div class="progress-bar" style="width: {score * 100}%; background: {color};"></div>
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    # Show message if filter excludes all sources
+    if not parts:
+        parts.append(
+            f'<div style="color: {COLORS.text_secondary}; text-align: center; padding: 2rem;">'
+            f'No sources match filter "{filter_option}"'
+            f"</div>"
         )
 
-        col1, col2 = st.columns(2)
-
-        # Extracted fields
-        with col1:
-            if source.extracted_fields:
-                st.markdown(
-                    f"""
-                <div style="font-size: 0.8rem; font-weight: 500; color: {COLORS["text_muted"]}; 
-                            text-transform: uppercase; letter-spacing: 0.025em; margin-bottom: 0.75rem;">
-                    Extracted Information
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-
-                for field_name, value in source.extracted_fields.items():
-                    if value:
-                        readable_name = field_name.replace("_", " ").title()
-                        display_value = str(value)
-                        if len(display_value) > 80:
-                            display_value = display_value[:77] + "..."
-                        st.markdown(
-                            f"""
-                        <div class="field-item field-present">
-                            <div class="field-label">{readable_name}</div>
-                            <div class="field-value">{display_value}</div>
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
-                        )
-
-        # Missing fields
-        with col2:
-            if source.missing_fields:
-                st.markdown(
-                    f"""
-                <div style="font-size: 0.8rem; font-weight: 500; color: {COLORS["text_muted"]}; 
-                            text-transform: uppercase; letter-spacing: 0.025em; margin-bottom: 0.75rem;">
-                    Missing Information
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-
-                for missing in source.missing_fields:
-                    readable_name = missing.field_name.replace("_", " ").title()
-                    partial_tag = (
-                        f" <span style='font-size: 0.7rem; color: {COLORS['warning']};'>(Partial)</span>"
-                        if missing.partially_answered
-                        else ""
-                    )
-                    st.markdown(
-                        f"""
-                    <div class="field-item field-missing">
-                        <div class="field-label">{readable_name}{partial_tag}</div>
-                        <div class="field-value" style="color: {COLORS["text_secondary"]};">{missing.reason}</div>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+    return "".join(parts)
+
+
+_SOURCES_HEADER_HTML = (
+    '<div class="section-header">Sources of Wealth</div>'
+    f'<div style="font-size: 0.8rem; color: {COLORS.text_muted}; margin-bottom: 0.5rem;">'
+    "Filter sources:"
+    "</div>"
+)
+_NO_SOURCES_HTML = (
+    '<div class="section-header">Sources of Wealth</div>'
+    '<div class="alert-box alert-warning"><div>'
+    '<div class="alert-title">No Sources Found</div>'
+    '<div class="alert-message">The document did not contain identifiable source '
+    "of wealth information.</div>"
+    "</div></div>"
+)
 
 
 def display_sources_section(result: ExtractionResult) -> None:
@@ -303,42 +468,21 @@ def display_sources_section(result: ExtractionResult) -> None:
     Args:
         result: The extraction result containing sources
     """
-    st.markdown(
-        '<div class="section-header">Sources of Wealth</div>',
-        unsafe_allow_html=True,
-    )
-
     if not result.sources_of_wealth:
-        st.markdown(
-            """
-        <div class="alert-box alert-warning">
-            <div>
-                <div class="alert-title">No Sources Found</div>
-                <div class="alert-message">The document did not contain identifiable source of wealth information.</div>
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.html(_NO_SOURCES_HTML)
         return
 
-    # Group sources by type
-    sources_by_type = defaultdict(list)
-    for source in result.sources_of_wealth:
-        source_type = (
-            source.source_type if hasattr(source, "source_type") else "Unknown"
-        )
-        sources_by_type[source_type].append(source)
+    st.html(_SOURCES_HEADER_HTML)
+    _display_filtered_sources(result)
 
-    # Filter controls
-    st.markdown(
-        f"""
-    <div style="font-size: 0.8rem; color: {COLORS["text_muted"]}; margin-bottom: 0.5rem;">
-        Filter sources:
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+
+@st.fragment
+def _display_filtered_sources(result: ExtractionResult) -> None:
+    """Display the filter control and the matching source listing.
+
+    Runs as a fragment, so changing the filter reruns only this block rather
+    than the whole results page.
+    """
     filter_option = st.radio(
         "Filter",
         options=["All", "Incomplete", "Complete"],
@@ -346,52 +490,51 @@ def display_sources_section(result: ExtractionResult) -> None:
         label_visibility="collapsed",
     )
 
-    # Display sources organized by type
-    for source_type, sources in sorted(sources_by_type.items()):
-        sources_to_display = sources
-        if filter_option == "Incomplete":
-            sources_to_display = [s for s in sources if s.completeness_score < 0.8]
-        elif filter_option == "Complete":
-            sources_to_display = [s for s in sources if s.completeness_score >= 0.8]
-
-        if sources_to_display:
-            # Type header
-            st.markdown(
-                f"""
-            <div style="margin-top: 1.5rem; margin-bottom: 1rem; padding-bottom: 0.5rem; border-bottom: 1px solid {COLORS["border"]};">
-                <div style="font-size: 0.9rem; font-weight: 600; color: {COLORS["text_primary"]}; text-transform: capitalize;">
-                    {source_type.replace("_", " ")} ({len(sources_to_display)})
-                </div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    # Each filter's listing is built once per result and reused on later toggles
+    st.html(
+        _get_section_html(
+            result,
+            f"sources_{filter_option}",
+            lambda r: _render_sources_html(r, filter_option),
+        )
+    )
 
-            for i, source in enumerate(sources_to_display):
-                display_source(source, i)
 
-    # Show message if filter excludes all sources
-    if filter_option != "All":
-        all_filtered = sum(
-            len(
-                [
-                    s
-                    for s in sources
-                    if (filter_option == "Incomplete" and s.completeness_score < 0.8)
-                    or (filter_option == "Complete" and s.completeness_score >= 0.8)
-                ]
-            )
-            for sources in sources_by_type.values()
+_QUESTION_ITEM_TEMPLATE = (
+    '<div class="question-item">'
+    '<span class="question-number">{number}.</span> '
+    '<span class="question-text">{question}</span>'
+    "</div>"
+)
+
+
+def _render_follow_up_html(result: ExtractionResult) -> str:
+    """Build the follow-up questions section as a single HTML string."""
+    header = '<div class="section-header">Follow-up Questions</div>'
+    questions = result.recommended_follow_up_questions
+
+    if not questions:
+        return (
+            f"{header}\n"
+            '<div class="alert-box alert-success"><div>'
+            '<div class="alert-title">Information Complete</div>'
+            '<div class="alert-message">All required information has been provided. '
+            "No follow-up questions needed.</div>"
+            "</div></div>"
         )
-        if all_filtered == 0:
-            st.markdown(
-                f"""
-            <div style="color: {COLORS["text_secondary"]}; text-align: center; padding: 2rem;">
-                No sources match filter "{filter_option}"
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+
+    question_count = len(questions)
+    items = "".join(
+        _QUESTION_ITEM_TEMPLATE.format(number=i, question=question)
+        for i, question in enumerate(questions, 1)
+    )
+    return (
+        f"{header}\n"
+        f'<div style="color: {COLORS.text_secondary}; margin-bottom: 1rem; font-size: 0.9rem;">'
+        f"{question_count} question{'s' if question_count != 1 else ''} recommended to complete missing information."
+        f"</div>\n"
+        f"{items}"
+    )
 
 
 def display_follow_up_questions(result: ExtractionResult) -> None:
@@ -400,81 +543,74 @@ def display_follow_up_questions(result: ExtractionResult) -> None:
     Args:
         result: The extraction result containing follow-up questions
     """
-    st.markdown(
-        '<div class="section-header">Follow-up Questions</div>', unsafe_allow_html=True
+    st.html(
+        _get_section_html(result, "follow_up", _render_follow_up_html),
     )
 
-    if not result.recommended_follow_up_questions:
-        st.markdown(
-            """
-        <div class="alert-box alert-success">
-            <div>
-                <div class="alert-title">Information Complete</div>
-                <div class="alert-message">All required information has been provided. No follow-up questions needed.</div>
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-        return
 
-    question_count = len(result.recommended_follow_up_questions)
-    st.markdown(
-        f"""
-    <div style="color: {COLORS["text_secondary"]}; margin-bottom: 1rem; font-size: 0.9rem;">
-        {question_count} question{"s" if question_count != 1 else ""} recommended to complete missing information.
-    </div>
-    """,
-        unsafe_allow_html=True,
+# Loading screen pieces, built once at import. The slider cycles through
+# _LOADING_MESSAGES in step with the slideText keyframes.
+_LOADING_MESSAGES = (
+    "Activating extraction agents...",
+    "Parsing document structure...",
+    "Identifying wealth sources...",
+    "Analysing employment income...",
+    "Reviewing business interests...",
+    "Examining property holdings...",
+    "Tracing inheritance records...",
+    "Validating gift documentation...",
+    "Checking investment portfolios...",
+    "Reviewing dividend history...",
+    "Analysing asset disposals...",
+    "Cross-referencing source chains...",
+    "Calculating completeness scores...",
+    "Identifying missing information...",
+    "Generating follow-up questions...",
+    "Finalising extraction...",
+)
+_LOADING_LINE_STYLE = (
+    f"font-size: 1rem; font-weight: 500; color: {COLORS.text_primary}; "
+    f"height: 1.5rem; line-height: 1.5rem;"
+)
+_LOADING_HEAD_HTML = (
+    '<div style="display: flex; flex-direction: column; align-items: center; '
+    'justify-content: center; min-height: 50vh; text-align: center;">'
+    '<div style="margin-bottom: 2rem;">'
+    f'<div style="width: 10px; height: 10px; border-radius: 50%; background: {COLORS.accent}; '
+    'display: inline-block; animation: pulse 1.5s ease-in-out infinite;"></div>'
+    "</div>"
+)
+_LOADING_FOOT_HTML = (
+    f'<div style="font-size: 0.8rem; color: {COLORS.text_muted};">'
+    "Please wait whilst we analyse your document"
+    "</div></div>"
+)
+_LOADING_CYCLE_HTML = (
+    _LOADING_HEAD_HTML
+    + '<div class="loading-text-container" style="height: 1.5rem; overflow: hidden; margin-bottom: 0.5rem;">'
+    + '<div class="loading-text-slider">'
+    + "".join(
+        f'<div style="{_LOADING_LINE_STYLE}">{message}</div>'
+        for message in _LOADING_MESSAGES
     )
+    + "</div></div>"
+    + _LOADING_FOOT_HTML
+)
 
-    for i, question in enumerate(result.recommended_follow_up_questions, 1):
-        st.markdown(
-            f"""
-        <div class="question-item">
-            <span class="question-number">{i}.</span>
-            <span class="question-text">{question}</span>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
 
+def display_loading_spinner(stage: str | None = None) -> None:
+    """Display the animated loading spinner.
 
-def display_loading_spinner() -> None:
-    """Display the animated loading spinner with cycling messages."""
-    st.markdown(get_loading_animation_css(), unsafe_allow_html=True)
-    st.markdown(
-        f"""
-    <div style="display: flex; flex-direction: column; align-items: center; justify-content: center; 
-                min-height: 50vh; text-align: center;">
-        <div style="margin-bottom: 2rem;">
-            <div style="width: 10px; height: 10px; border-radius: 50%; background: {COLORS["accent"]}; 
-                        display: inline-block; animation: pulse 1.5s ease-in-out infinite;"></div>
-        </div>
-        <div class="loading-text-container" style="height: 1.5rem; overflow: hidden; margin-bottom: 0.5rem;">
-            <div class="loading-text-slider">
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Activating extraction agents...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Parsing document structure...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Identifying wealth sources...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Analysing employment income...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Reviewing business interests...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Examining property holdings...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Tracing inheritance records...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Validating gift documentation...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Checking investment portfolios...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Reviewing dividend history...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Analysing asset disposals...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Cross-referencing source chains...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Calculating completeness scores...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Identifying missing information...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Generating follow-up questions...</div>
-                <div style="font-size: 1rem; font-weight: 500; color: #f8fafc; height: 1.5rem; line-height: 1.5rem;">Finalising extraction...</div>
-            </div>
-        </div>
-        <div style="font-size: 0.8rem; color: #64748b;">
-            Please wait whilst we analyse your document
-        </div>
-    </div>
-    """,
-        unsafe_allow_html=True,
+    Args:
+        stage: Current pipeline stage to show; cycles generic messages if omitted
+    """
+    st.html(get_loading_animation_css())
+    if stage is None:
+        st.html(_LOADING_CYCLE_HTML)
+        return
+
+    st.html(
+        f"{_LOADING_HEAD_HTML}"
+        f'<div style="{_LOADING_LINE_STYLE} margin-bottom: 0.5rem;">{stage}</div>'
+        f"{_LOADING_FOOT_HTML}"
     )
@@ -3,21 +3,77 @@
 Utility functions for validation, processing, and data transformation.
 """
 
-import json
+import asyncio
+import concurrent.futures
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from src.agents.orchestrator import Orchestrator
 from src.loaders.document_loader import DocumentLoader, EmptyDocumentError
 from src.models.schemas import ExtractionResult
 from src.utils.logging_config import get_logger
 
 from .styles import COLORS
 
+if TYPE_CHECKING:
+    from src.agents.orchestrator import Orchestrator
+
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Configuration constants
 MAX_FILE_SIZE_MB = 10
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
-ALLOWED_EXTENSIONS = [".docx"]
+ALLOWED_EXTENSIONS = (".docx",)
+DOCX_MAGIC = b"PK\x03\x04"  # .docx files are zip archives
+RESULT_CACHE_MAX_ENTRIES = 64
+
+# Uploads are staged in RAM-backed storage where available (Linux); elsewhere
+# the platform default temp directory is used.
+STAGING_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Process-wide caches keyed by document digest. Streamlit only re-executes
+# app.py on rerun, so this module-level state survives reruns and is shared
+# across sessions (hence the lock). Parsed narratives are kept separately so a
+# retry after a failed extraction skips re-parsing the .docx.
+_result_cache: OrderedDict[str, ExtractionResult] = OrderedDict()
+_narrative_cache: OrderedDict[str, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Long-lived event loop shared by all reruns, so HTTP clients created by the
+# orchestrator keep their connection pools between uploads.
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_lock = threading.Lock()
+
+# The orchestrator holds no per-run state, only its agents, so one instance
+# serves every upload (as run_extraction.py does across cases).
+_orchestrator: "Orchestrator | None" = None
+_orchestrator_lock = threading.Lock()
+
+
+# (hex color, status label, CSS class) per completeness band, lowest first
+_COMPLETENESS_BANDS = (
+    (COLORS.error, "Incomplete", "incomplete"),
+    (COLORS.warning, "Partial", "partial"),
+    (COLORS.success, "Complete", "complete"),
+)
+
+
+def get_completeness_display(score: float) -> tuple[str, str, str]:
+    """Return color, status and CSS class for a completeness score.
+
+    Args:
+        score: Completeness score between 0 and 1
+
+    Returns:
+        Tuple of (hex color, status label, CSS class name)
+    """
+    return _COMPLETENESS_BANDS[(score >= 0.5) + (score >= 0.8)]
 
 
 def get_completeness_color(score: float) -> tuple[str, str]:
@@ -29,12 +85,8 @@ def get_completeness_color(score: float) -> tuple[str, str]:
     Returns:
         Tuple of (hex color, status label)
     """
-    if score >= 0.8:
-        return COLORS["success"], "Complete"
-    elif score >= 0.5:
-        return COLORS["warning"], "Partial"
-    else:
-        return COLORS["error"], "Incomplete"
+    color, status, _ = get_completeness_display(score)
+    return color, status
 
 
 def get_status_class(score: float) -> str:
@@ -46,16 +98,14 @@ def get_status_class(score: float) -> str:
     Returns:
         CSS class name
     """
-    if score >= 0.8:
-        return "complete"
-    elif score >= 0.5:
-        return "partial"
-    else:
-        return "incomplete"
+    return get_completeness_display(score)[2]
 
 
 def validate_uploaded_file(uploaded_file) -> tuple[bool, str]:
-    """Validate uploaded file for type and size.
+    """Validate uploaded file for type, size and zip signature.
+
+    Only metadata and the first few bytes are inspected, so rejected uploads
+    are never read in full.
 
     Args:
         uploaded_file: Streamlit uploaded file object
@@ -68,7 +118,7 @@ def validate_uploaded_file(uploaded_file) -> tuple[bool, str]:
 
     # Check file extension
     filename = uploaded_file.name.lower()
-    if not any(filename.endswith(ext) for ext in ALLOWED_EXTENSIONS):
+    if not filename.endswith(ALLOWED_EXTENSIONS):
         return False, (
             f"Invalid file type. Please upload a Word document (.docx). "
             f"Received: .{filename.split('.')[-1] if '.' in filename else 'unknown'}"
@@ -87,6 +137,10 @@ def validate_uploaded_file(uploaded_file) -> tuple[bool, str]:
     if file_size == 0:
         return False, "File is empty (0 bytes)."
 
+    # Peek at the zip signature without copying or consuming the upload
+    if bytes(uploaded_file.getbuffer()[: len(DOCX_MAGIC)]) != DOCX_MAGIC:
+        return False, ("File is not a valid Word document. Please upload a .docx file.")
+
     return True, ""
 
 
@@ -99,16 +153,192 @@ def export_to_json(result: ExtractionResult) -> str:
     Returns:
         JSON string
     """
-    result_dict = result.model_dump(mode="json")
-    return json.dumps(result_dict, indent=2, ensure_ascii=False)
+    # Serialized directly by pydantic-core; output matches json.dumps on
+    # model_dump(mode="json") with indent=2 and ensure_ascii=False.
+    return result.model_dump_json(indent=2)
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use.
+
+    Returns:
+        Event loop running forever on a daemon thread
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_event_loop.run_forever, name="sow-event-loop", daemon=True
+            ).start()
+        return _event_loop
+
+
+def submit_async(coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+    """Schedule a coroutine on the background event loop without waiting.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        Future that resolves to the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background event loop and wait for its result.
+
+    Used instead of asyncio.run, which creates and tears down a fresh loop on
+    every Streamlit rerun.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    return submit_async(coro).result()
+
+
+def get_orchestrator() -> "Orchestrator":
+    """Get the shared extraction orchestrator, creating it on first use.
+
+    The import is deferred so the LLM client stack (pydantic-ai, openai)
+    loads during the first extraction rather than delaying the initial page
+    render.
+
+    Returns:
+        The process-wide Orchestrator instance
+    """
+    global _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            from src.agents.orchestrator import Orchestrator
+
+            _orchestrator = Orchestrator()
+        return _orchestrator
+
+
+def get_document_digest(file_bytes: bytes | memoryview) -> str:
+    """Return a short content hash identifying an uploaded document.
+
+    Args:
+        file_bytes: The uploaded file contents
+
+    Returns:
+        Hex digest of the file contents
+    """
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+
+def stage_uploaded_file(uploaded_file) -> tuple[str, str]:
+    """Write an uploaded file to a temporary file for processing.
+
+    Only the returned path and digest need to be kept in session state, rather
+    than a full copy of the document bytes.
+
+    Args:
+        uploaded_file: Streamlit uploaded file object
+
+    Returns:
+        Tuple of (temporary file path, document digest)
+    """
+    buffer = uploaded_file.getbuffer()
+    digest = get_document_digest(buffer)
+
+    fd, path = tempfile.mkstemp(suffix=".docx", dir=STAGING_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buffer)
+    except Exception:
+        os.unlink(path)
+        raise
+
+    return path, digest
+
+
+def discard_staged_file(path: str | None) -> None:
+    """Remove a temporary file created by stage_uploaded_file.
+
+    Args:
+        path: Temporary file path (ignored if None or already removed)
+    """
+    if path:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
 
+def _cache_get(cache: OrderedDict[str, T], digest: str) -> T | None:
+    """Look up a cached entry, marking it as recently used."""
+    with _cache_lock:
+        value = cache.get(digest)
+        if value is not None:
+            cache.move_to_end(digest)
+        return value
 
-async def process_document(file_bytes: bytes, filename: str) -> ExtractionResult:
+
+def _cache_put(cache: OrderedDict[str, T], digest: str, value: T) -> None:
+    """Store a cache entry, evicting the least recently used one."""
+    with _cache_lock:
+        cache[digest] = value
+        cache.move_to_end(digest)
+        while len(cache) > RESULT_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+def _get_cached_result(digest: str) -> ExtractionResult | None:
+    """Look up a previously extracted result."""
+    return _cache_get(_result_cache, digest)
+
+
+def _cache_result(digest: str, result: ExtractionResult) -> None:
+    """Store an extraction result."""
+    _cache_put(_result_cache, digest, result)
+
+
+def get_export_filename(result: ExtractionResult) -> str:
+    """Build the download filename for an extraction result.
+
+    Args:
+        result: The extraction result to export
+
+    Returns:
+        Filename with sanitised account holder name and extraction timestamp
+    """
+    timestamp = result.metadata.extracted_at.strftime("%Y%m%d_%H%M%S")
+    account_name = result.metadata.account_holder.name.replace(" ", "_").replace(
+        ",", ""
+    )
+    return f"sow_{account_name}_{timestamp}.json"
+
+
+def _load_narrative(file_path: str, filename: str) -> str:
+    """Read and parse a staged .docx into narrative text."""
+    with open(file_path, "rb") as f:
+        return DocumentLoader.load_from_stream(f, filename)
+
+
+async def process_document(
+    file_path: str,
+    filename: str,
+    digest: str | None = None,
+    on_progress: Callable[[str], None] | None = None,
+) -> ExtractionResult:
     """Process uploaded document through extraction pipeline.
 
+    Results and parsed text are memoized by content hash, so re-uploading the
+    same document returns the earlier extraction without re-running the LLM
+    pipeline, and retrying after a failure skips re-parsing the .docx. Failed
+    extractions are not cached.
+
     Args:
-        file_bytes: The uploaded file bytes
+        file_path: Path to the staged .docx file
         filename: Name of the uploaded file
+        digest: Content digest from stage_uploaded_file (computed if omitted)
+        on_progress: Optional callback notified as each pipeline stage starts
 
     Returns:
         ExtractionResult with all extracted data
@@ -117,10 +347,37 @@ async def process_document(file_bytes: bytes, filename: str) -> ExtractionResult
         InvalidFileError: If file is not a valid .docx
         EmptyDocumentError: If document has no text content
     """
+    if digest is None:
+        with open(file_path, "rb") as f:
+            digest = get_document_digest(f.read())
+    cached = _get_cached_result(digest)
+    if cached is not None:
+        logger.info(f"Reusing cached extraction for {filename} ({digest})")
+        return cached
+
     logger.info(f"Processing uploaded file: {filename}")
+    if on_progress is not None:
+        on_progress("Parsing document structure...")
 
     # Load document first - raises EmptyDocumentError if empty
-    narrative = DocumentLoader.load_from_bytes(file_bytes, filename)
+    narrative = _cache_get(_narrative_cache, digest)
+    if narrative is None:
+        # Parse off the shared event loop so other sessions' LLM calls keep
+        # going, and set up the orchestrator alongside it (on first use this
+        # imports the LLM client stack). return_exceptions makes gather wait
+        # for both threads even when the loader fails; its error is then
+        # re-raised as-is.
+        parsed, built = await asyncio.gather(
+            asyncio.to_thread(_load_narrative, file_path, filename),
+            asyncio.to_thread(get_orchestrator),
+            return_exceptions=True,
+        )
+        if isinstance(parsed, BaseException):
+            raise parsed
+        if isinstance(built, BaseException):
+            raise built
+        _cache_put(_narrative_cache, digest, parsed)
+        narrative = parsed
 
     # Validate minimum content
     if len(narrative.strip()) < 50:
@@ -133,12 +390,20 @@ async def process_document(file_bytes: bytes, filename: str) -> ExtractionResult
     logger.info(f"Document loaded: {len(narrative)} characters")
 
     # Process through orchestrator
-    orchestrator = Orchestrator()
-    result = await orchestrator.process(narrative)
+    orchestrator = get_orchestrator()
+    result = await orchestrator.process(narrative, on_progress=on_progress)
 
     logger.info(
         f"Extraction complete: {result.summary.total_sources_identified} sources, "
         f"{result.summary.overall_completeness_score:.0%} complete"
     )
 
+    # The orchestrator reports failures as a placeholder result rather than
+    # raising; keep those out of the cache so a re-upload retries
+    from src.agents.orchestrator import is_failed_extraction
+
+    if is_failed_extraction(result):
+        logger.warning(f"Extraction failed for {filename}; result not cached")
+    else:
+        _cache_result(digest, result)
     return result
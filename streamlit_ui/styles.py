@@ -3,38 +3,42 @@
 This module contains all CSS styling for the Palindrome Wealth Intelligence UI.
 """
 
-# Premium dark palette - understated luxury for wealth management
-COLORS = {
-    "primary": "#09090b",  # Near black - main background
-    "secondary": "#18181b",  # Dark gray - card backgrounds
-    "tertiary": "#27272a",  # Medium gray - borders, hover
-    "accent": "#64748b",  # Slate grey - understated premium
-    "accent_light": "#94a3b8",  # Lighter slate for hover
-    "success": "#22c55e",  # Green - complete/success
-    "warning": "#f59e0b",  # Amber - partial/warning
-    "error": "#ef4444",  # Red - incomplete/error
-    "text_primary": "#f8fafc",  # Off-white text
-    "text_secondary": "#94a3b8",  # Muted slate text
-    "text_muted": "#64748b",  # More muted text
-    "border": "#27272a",  # Subtle borders
-    "card_bg": "#18181b",  # Card background
-}
+import re
+from dataclasses import asdict, dataclass
 
 
-def get_custom_css() -> str:
-    """Generate the custom CSS for the Palindrome dark theme.
+@dataclass(frozen=True, slots=True)
+class _Colors:
+    """Premium dark palette - understated luxury for wealth management."""
 
-    Returns:
-        Complete CSS string with all styles applied.
-    """
-    return f"""
+    primary: str = "#09090b"  # Near black - main background
+    secondary: str = "#18181b"  # Dark gray - card backgrounds
+    tertiary: str = "#27272a"  # Medium gray - borders, hover
+    accent: str = "#64748b"  # Slate grey - understated premium
+    accent_light: str = "#94a3b8"  # Lighter slate for hover
+    success: str = "#22c55e"  # Green - complete/success
+    warning: str = "#f59e0b"  # Amber - partial/warning
+    error: str = "#ef4444"  # Red - incomplete/error
+    text_primary: str = "#f8fafc"  # Off-white text
+    text_secondary: str = "#94a3b8"  # Muted slate text
+    text_muted: str = "#64748b"  # More muted text
+    border: str = "#27272a"  # Subtle borders
+    card_bg: str = "#18181b"  # Card background
+
+
+COLORS = _Colors()
+
+
+# Theme stylesheet with {color_name} placeholders for COLORS. Braces that
+# belong to the CSS itself are doubled for str.format.
+_CSS_TEMPLATE = """
 <style>
     /* Import clean font */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
     /* Global styles */
     .stApp {{
-        background: {COLORS["primary"]};
+        background: {primary};
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
     }}
     
@@ -47,12 +51,12 @@ def get_custom_css() -> str:
     /* Header styling */
     .main-header {{
         padding: 0 0 2rem 0;
-        border-bottom: 1px solid {COLORS["border"]};
+        border-bottom: 1px solid {border};
         margin-bottom: 2rem;
     }}
     
     .main-header h1 {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
         font-size: 2rem;
         font-weight: 600;
         margin: 0 0 0.5rem 0;
@@ -60,27 +64,33 @@ def get_custom_css() -> str:
     }}
     
     .main-header p {{
-        color: {COLORS["text_secondary"]};
+        color: {text_secondary};
         font-size: 1rem;
         margin: 0;
         font-weight: 400;
     }}
     
     /* Card styling */
+    /* Row of metric cards emitted as one HTML block */
+    .metric-grid {{
+        display: grid;
+        gap: 1rem;
+    }}
+    
     .metric-card {{
-        background: {COLORS["card_bg"]};
-        border: 1px solid {COLORS["border"]};
+        background: {card_bg};
+        border: 1px solid {border};
         border-radius: 12px;
         padding: 1.5rem;
         transition: border-color 0.2s ease;
     }}
     
     .metric-card:hover {{
-        border-color: {COLORS["tertiary"]};
+        border-color: {tertiary};
     }}
     
     .metric-label {{
-        color: {COLORS["text_muted"]};
+        color: {text_muted};
         font-size: 0.75rem;
         font-weight: 500;
         text-transform: uppercase;
@@ -89,14 +99,14 @@ def get_custom_css() -> str:
     }}
     
     .metric-value {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-size: 1.75rem;
         font-weight: 600;
         letter-spacing: -0.025em;
     }}
     
     .metric-subtitle {{
-        color: {COLORS["text_secondary"]};
+        color: {text_secondary};
         font-size: 0.875rem;
         margin-top: 0.5rem;
     }}
@@ -115,36 +125,36 @@ def get_custom_css() -> str:
     
     .status-complete {{
         background: rgba(34, 197, 94, 0.1);
-        color: {COLORS["success"]};
+        color: {success};
         border: 1px solid rgba(34, 197, 94, 0.2);
     }}
     
     .status-partial {{
         background: rgba(245, 158, 11, 0.1);
-        color: {COLORS["warning"]};
+        color: {warning};
         border: 1px solid rgba(245, 158, 11, 0.2);
     }}
     
     .status-incomplete {{
         background: rgba(239, 68, 68, 0.1);
-        color: {COLORS["error"]};
+        color: {error};
         border: 1px solid rgba(239, 68, 68, 0.2);
     }}
     
     /* Section headers */
     .section-header {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-size: 1.125rem;
         font-weight: 600;
         margin: 2rem 0 1rem 0;
         padding-bottom: 0.75rem;
-        border-bottom: 1px solid {COLORS["border"]};
+        border-bottom: 1px solid {border};
         letter-spacing: -0.01em;
     }}
     
     /* Progress bar */
     .progress-container {{
-        background: {COLORS["tertiary"]};
+        background: {tertiary};
         border-radius: 4px;
         height: 6px;
         overflow: hidden;
@@ -159,8 +169,8 @@ def get_custom_css() -> str:
     
     /* Source card */
     .source-card {{
-        background: {COLORS["card_bg"]};
-        border: 1px solid {COLORS["border"]};
+        background: {card_bg};
+        border: 1px solid {border};
         border-radius: 12px;
         margin-bottom: 1rem;
         overflow: hidden;
@@ -171,17 +181,17 @@ def get_custom_css() -> str:
         display: flex;
         justify-content: space-between;
         align-items: center;
-        border-bottom: 1px solid {COLORS["border"]};
+        border-bottom: 1px solid {border};
     }}
     
     .source-title {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-weight: 500;
         font-size: 0.9375rem;
     }}
     
     .source-type {{
-        color: {COLORS["text_muted"]};
+        color: {text_muted};
         font-size: 0.8125rem;
     }}
     
@@ -189,16 +199,54 @@ def get_custom_css() -> str:
         padding: 1.5rem;
     }}
     
+    /* Collapsible source cards (<details>) */
+    details.source-card > summary {{
+        cursor: pointer;
+        list-style: none;
+    }}
+    
+    details.source-card > summary::-webkit-details-marker {{
+        display: none;
+    }}
+    
+    details.source-card > summary::after {{
+        content: "\\25B8";
+        color: {text_muted};
+        transition: transform 0.2s ease;
+    }}
+    
+    details.source-card[open] > summary::after {{
+        transform: rotate(90deg);
+    }}
+    
+    details.source-card:not([open]) > summary {{
+        border-bottom: none;
+    }}
+    
+    details.source-overflow > summary {{
+        cursor: pointer;
+        color: {text_secondary};
+        font-size: 0.85rem;
+        margin-bottom: 1rem;
+    }}
+    
     /* Field items */
+    /* Extracted / missing field columns inside a source card */
+    .source-columns {{
+        display: grid;
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+        gap: 1rem;
+    }}
+    
     .field-item {{
         padding: 0.75rem 1rem;
-        background: {COLORS["secondary"]};
+        background: {secondary};
         border-radius: 8px;
         margin-bottom: 0.5rem;
     }}
     
     .field-label {{
-        color: {COLORS["text_muted"]};
+        color: {text_muted};
         font-size: 0.75rem;
         font-weight: 500;
         text-transform: uppercase;
@@ -206,17 +254,17 @@ def get_custom_css() -> str:
     }}
     
     .field-value {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-size: 0.875rem;
         margin-top: 0.25rem;
     }}
     
     .field-missing {{
-        border-left: 3px solid {COLORS["warning"]};
+        border-left: 3px solid {warning};
     }}
     
     .field-present {{
-        border-left: 3px solid {COLORS["success"]};
+        border-left: 3px solid {success};
     }}
     
     /* Alert boxes */
@@ -235,7 +283,7 @@ def get_custom_css() -> str:
     }}
     
     .alert-error .alert-title {{
-        color: {COLORS["error"]};
+        color: {error};
     }}
     
     .alert-success {{
@@ -244,7 +292,7 @@ def get_custom_css() -> str:
     }}
     
     .alert-success .alert-title {{
-        color: {COLORS["success"]};
+        color: {success};
     }}
     
     .alert-warning {{
@@ -253,7 +301,7 @@ def get_custom_css() -> str:
     }}
     
     .alert-warning .alert-title {{
-        color: {COLORS["warning"]};
+        color: {warning};
     }}
     
     .alert-title {{
@@ -262,7 +310,7 @@ def get_custom_css() -> str:
     }}
     
     .alert-message {{
-        color: {COLORS["text_secondary"]};
+        color: {text_secondary};
         font-size: 0.875rem;
         margin-top: 0.25rem;
     }}
@@ -270,28 +318,28 @@ def get_custom_css() -> str:
     /* Question items */
     .question-item {{
         padding: 1rem 1.25rem;
-        background: {COLORS["secondary"]};
-        border: 1px solid {COLORS["border"]};
+        background: {secondary};
+        border: 1px solid {border};
         border-radius: 8px;
         margin-bottom: 0.75rem;
     }}
     
     .question-number {{
-        color: {COLORS["accent"]};
+        color: {accent};
         font-weight: 600;
         font-size: 0.875rem;
         margin-right: 0.5rem;
     }}
     
     .question-text {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-size: 0.9375rem;
     }}
     
     /* Upload area */
     .upload-area {{
-        background: {COLORS["secondary"]};
-        border: 2px dashed {COLORS["border"]};
+        background: {secondary};
+        border: 2px dashed {border};
         border-radius: 12px;
         padding: 2rem;
         text-align: center;
@@ -299,13 +347,13 @@ def get_custom_css() -> str:
     }}
     
     .upload-area:hover {{
-        border-color: {COLORS["accent"]};
+        border-color: {accent};
     }}
     
     /* Processing indicator */
     .processing-box {{
-        background: {COLORS["card_bg"]};
-        border: 1px solid {COLORS["border"]};
+        background: {card_bg};
+        border: 1px solid {border};
         border-radius: 12px;
         padding: 1.5rem;
         display: flex;
@@ -314,20 +362,20 @@ def get_custom_css() -> str:
     }}
     
     .processing-text {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
         font-weight: 500;
     }}
     
     .processing-subtext {{
-        color: {COLORS["text_secondary"]};
+        color: {text_secondary};
         font-size: 0.875rem;
         margin-top: 0.25rem;
     }}
     
     /* Sidebar styling */
     [data-testid="stSidebar"] {{
-        background: {COLORS["secondary"]};
-        border-right: 1px solid {COLORS["border"]};
+        background: {secondary};
+        border-right: 1px solid {border};
     }}
     
     [data-testid="stSidebar"] .block-container {{
@@ -335,14 +383,14 @@ def get_custom_css() -> str:
     }}
     
     /* Override Streamlit defaults */
-    .stMarkdown {{
-        color: {COLORS["text_primary"]};
+    .stMarkdown, .stHtml {{
+        color: {text_primary};
     }}
     
     .stButton > button {{
-        background: {COLORS["tertiary"]};
-        color: {COLORS["text_primary"]};
-        border: 1px solid {COLORS["border"]};
+        background: {tertiary};
+        color: {text_primary};
+        border: 1px solid {border};
         border-radius: 8px;
         font-weight: 500;
         padding: 0.625rem 1.25rem;
@@ -350,46 +398,46 @@ def get_custom_css() -> str:
     }}
     
     .stButton > button:hover {{
-        background: {COLORS["border"]};
-        border-color: {COLORS["text_muted"]};
+        background: {border};
+        border-color: {text_muted};
     }}
     
     .stButton > button[kind="primary"] {{
-        background: {COLORS["accent"]};
+        background: {accent};
         color: white;
         border: none;
     }}
     
     .stButton > button[kind="primary"]:hover {{
-        background: {COLORS["accent_light"]};
+        background: {accent_light};
     }}
     
     /* File uploader - force all text to be visible */
     [data-testid="stFileUploader"] {{
-        background: {COLORS["secondary"]};  
-        border: 1px dashed {COLORS["accent"]};  
+        background: {secondary};  
+        border: 1px dashed {accent};  
         border-radius: 12px;
         padding: 1rem;
     }}
     
     [data-testid="stFileUploader"]:hover {{
-        border-color: {COLORS["accent_light"]};
+        border-color: {accent_light};
     }}
     
     [data-testid="stFileUploader"] section {{
-        border-color: {COLORS["border"]} !important;
-        background: {COLORS["secondary"]} !important;
+        border-color: {border} !important;
+        background: {secondary} !important;
     }}
     
     [data-testid="stFileUploader"] label,
     [data-testid="stFileUploader"] span,
     [data-testid="stFileUploader"] p,
     [data-testid="stFileUploader"] div {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     [data-testid="stFileUploader"] small {{
-        color: {COLORS["text_secondary"]} !important;
+        color: {text_secondary} !important;
     }}
     
     /* File uploader drag text and file name */
@@ -399,76 +447,76 @@ def get_custom_css() -> str:
     [data-testid="stFileUploaderDropzone"] div,
     [data-testid="stFileUploaderDropzoneInstructions"] span,
     [data-testid="stFileUploaderDropzoneInstructions"] div {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     /* Browse files button */
     [data-testid="stFileUploader"] button,
     [data-testid="stFileUploaderDropzone"] button {{
-        background: {COLORS["tertiary"]} !important;
-        color: {COLORS["text_primary"]} !important;
-        border: 1px solid {COLORS["border"]} !important;
+        background: {tertiary} !important;
+        color: {text_primary} !important;
+        border: 1px solid {border} !important;
     }}
     
     /* Uploaded file info */
     [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"],
     [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] span,
     [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] div {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     /* Delete file button */
     [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] button {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     /* Expander/Toggle styling - dark theme */
     .streamlit-expanderHeader,
     [data-testid="stExpander"] summary,
     [data-testid="stExpander"] > div:first-child {{
-        background: {COLORS["card_bg"]} !important;
-        border: 1px solid {COLORS["border"]} !important;
+        background: {card_bg} !important;
+        border: 1px solid {border} !important;
         border-radius: 8px !important;
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
         font-weight: 500;
     }}
     
     [data-testid="stExpander"] summary span,
     [data-testid="stExpander"] summary p,
     [data-testid="stExpander"] summary div {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     [data-testid="stExpander"] svg {{
-        fill: {COLORS["text_primary"]} !important;
-        stroke: {COLORS["text_primary"]} !important;
+        fill: {text_primary} !important;
+        stroke: {text_primary} !important;
     }}
     
     .streamlit-expanderContent,
     [data-testid="stExpander"] > div:last-child {{
-        background: {COLORS["card_bg"]} !important;
-        border: 1px solid {COLORS["border"]} !important;
+        background: {card_bg} !important;
+        border: 1px solid {border} !important;
         border-top: none !important;
         border-radius: 0 0 8px 8px !important;
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     /* Selectbox - dark background with light text */
     [data-testid="stSelectbox"] {{
-        color: {COLORS["text_primary"]};
+        color: {text_primary};
     }}
     
     [data-testid="stSelectbox"] > div > div {{
-        background: {COLORS["secondary"]} !important;
-        color: {COLORS["text_primary"]} !important;
-        border-color: {COLORS["border"]} !important;
+        background: {secondary} !important;
+        color: {text_primary} !important;
+        border-color: {border} !important;
     }}
     
     /* Selectbox dropdown options */
     [data-testid="stSelectbox"] [role="listbox"],
     [data-testid="stSelectbox"] [role="option"] {{
-        background: {COLORS["secondary"]} !important;
-        color: {COLORS["text_primary"]} !important;
+        background: {secondary} !important;
+        color: {text_primary} !important;
     }}
     
     /* Radio buttons / Toggle buttons */
@@ -478,9 +526,9 @@ def get_custom_css() -> str:
     }}
     
     [data-testid="stRadio"] label {{
-        background: {COLORS["secondary"]} !important;
-        color: {COLORS["text_primary"]} !important;
-        border: 1px solid {COLORS["border"]} !important;
+        background: {secondary} !important;
+        color: {text_primary} !important;
+        border: 1px solid {border} !important;
         border-radius: 8px !important;
         padding: 0.5rem 1rem !important;
         cursor: pointer;
@@ -488,45 +536,45 @@ def get_custom_css() -> str:
     }}
     
     [data-testid="stRadio"] label:hover {{
-        border-color: {COLORS["accent"]} !important;
+        border-color: {accent} !important;
     }}
     
     [data-testid="stRadio"] label[data-checked="true"],
     [data-testid="stRadio"] input:checked + div {{
-        background: {COLORS["accent"]} !important;
-        border-color: {COLORS["accent"]} !important;
+        background: {accent} !important;
+        border-color: {accent} !important;
     }}
     
     /* Global text colour - force white/light text everywhere */
     .stApp, .stApp p, .stApp span, .stApp div, .stApp label {{
-        color: {COLORS["text_primary"]} !important;
+        color: {text_primary} !important;
     }}
     
     /* Override for muted text where needed */
     .text-muted {{
-        color: {COLORS["text_muted"]} !important;
+        color: {text_muted} !important;
     }}
     
     .text-secondary {{
-        color: {COLORS["text_secondary"]} !important;
+        color: {text_secondary} !important;
     }}
     
     /* Text area */
     .stTextArea textarea {{
-        background: {COLORS["secondary"]};
-        border: 1px solid {COLORS["border"]};
-        color: {COLORS["text_primary"]};
+        background: {secondary};
+        border: 1px solid {border};
+        color: {text_primary};
         border-radius: 8px;
     }}
     
     /* Code block */
     .stCodeBlock {{
-        background: {COLORS["secondary"]} !important;
+        background: {secondary} !important;
     }}
     
     /* Download button */
     .stDownloadButton > button {{
-        background: {COLORS["accent"]};
+        background: {accent};
         color: white;
         border: none;
     }}
@@ -540,57 +588,75 @@ def get_custom_css() -> str:
     
     /* Checkbox */
     .stCheckbox label {{
-        color: {COLORS["text_secondary"]};
+        color: {text_secondary};
     }}
     
     /* Divider */
     hr {{
-        border-color: {COLORS["border"]};
+        border-color: {border};
         margin: 2rem 0;
     }}
     
     /* Info/warning/error boxes override */
     .stAlert {{
-        background: {COLORS["card_bg"]};
-        border: 1px solid {COLORS["border"]};
+        background: {card_bg};
+        border: 1px solid {border};
         border-radius: 8px;
     }}
 </style>
 """
 
 
-def get_loading_animation_css() -> str:
-    """Get CSS for the loading animation.
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Streamlit drops any element a rerun does not re-emit, so the theme has to
+    be sent on every rerun; trimming it keeps that payload small.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
+
+
+_CUSTOM_CSS = _minify_css(_CSS_TEMPLATE.format(**asdict(COLORS)))
+
+
+def get_custom_css() -> str:
+    """Get the custom CSS for the Palindrome dark theme.
+
+    The stylesheet only depends on COLORS, so it is rendered once at import
+    rather than on every Streamlit rerun.
 
     Returns:
-        CSS string for loading animations.
+        Complete CSS string with all styles applied.
+    """
+    return _CUSTOM_CSS
+
+
+_LOADING_ANIMATION_CSS = _minify_css(
     """
-    return """
 <style>
     @keyframes pulse {
         0%, 100% { opacity: 0.3; transform: scale(1); }
         50% { opacity: 1; transform: scale(1.5); }
     }
+    /* One step per loading message (16 x 1.5rem) */
     @keyframes slideText {
-        0% { transform: translateY(0); }
-        6.25% { transform: translateY(-1.5rem); }
-        12.5% { transform: translateY(-3rem); }
-        18.75% { transform: translateY(-4.5rem); }
-        25% { transform: translateY(-6rem); }
-        31.25% { transform: translateY(-7.5rem); }
-        37.5% { transform: translateY(-9rem); }
-        43.75% { transform: translateY(-10.5rem); }
-        50% { transform: translateY(-12rem); }
-        56.25% { transform: translateY(-13.5rem); }
-        62.5% { transform: translateY(-15rem); }
-        68.75% { transform: translateY(-16.5rem); }
-        75% { transform: translateY(-18rem); }
-        81.25% { transform: translateY(-19.5rem); }
-        87.5% { transform: translateY(-21rem); }
-        93.75%, 100% { transform: translateY(-22.5rem); }
+        from { transform: translateY(0); }
+        to { transform: translateY(-24rem); }
     }
     .loading-text-slider {
-        animation: slideText 80s steps(1) infinite;
+        animation: slideText 80s steps(16, end) infinite;
     }
 </style>
 """
+)
+
+
+def get_loading_animation_css() -> str:
+    """Get CSS for the loading animation.
+
+    Returns:
+        CSS string for loading animations.
+    """
+    return _LOADING_ANIMATION_CSS
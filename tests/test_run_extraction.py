@@ -0,0 +1,435 @@
+"""Unit tests for the evaluation runner in run_extraction.py (deterministic, no LLM calls).
+
+pytest tests/test_run_extraction.py -v
+"""
+
+import argparse
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from run_extraction import (
+    ExtractionRunner,
+    FieldComparisonResult,
+    FieldComparisonVerdict,
+    LLMFieldEvaluator,
+    _best_source_assignment,
+    _normalize_text,
+    _positive_int,
+)
+from src.models.schemas import SourceOfWealth, SourceType
+from src.utils.logging_config import remove_run_file_handler
+
+
+@pytest.fixture
+def runner(tmp_path):
+    """Runner writing into a temporary results directory."""
+    runner = ExtractionRunner(tmp_path)
+    yield runner
+    remove_run_file_handler(runner._run_log_handler)
+
+
+def _make_evaluator(monkeypatch, **kwargs) -> LLMFieldEvaluator:
+    """Helper to build an evaluator whose LLM calls are mocked."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    evaluator = LLMFieldEvaluator(**kwargs)
+
+    async def run(prompt, output_type):
+        fields = {
+            "equivalent": True,
+            "actual_has_more_detail": True,
+            "expected_has_more_detail": False,
+        }
+        if output_type is FieldComparisonResult:
+            fields["reasoning"] = "Same employer"
+        return MagicMock(output=output_type(**fields))
+
+    evaluator._agent = MagicMock()
+    evaluator._agent.run = AsyncMock(side_effect=run)
+    return evaluator
+
+
+def _actual_gift(donor_name: str) -> SourceOfWealth:
+    """Helper to build an extracted gift source."""
+    return SourceOfWealth(  # type: ignore[call-arg]
+        source_type=SourceType.GIFT,
+        source_id="SOW_001",
+        description="Gift",
+        extracted_fields={"donor_name": donor_name},
+        completeness_score=1.0,
+    )
+
+
+def _expected_gift(donor_name: str) -> dict:
+    """Helper to build a ground-truth gift source."""
+    return {"source_type": "gift", "extracted_fields": {"donor_name": donor_name}}
+
+
+class TestBestSourceAssignment:
+    """Tests for _best_source_assignment."""
+
+    def test_beats_greedy(self):
+        """Test that the total score is maximised where greedy pairing is not."""
+        # Greedy takes (0, 0) for 2 and leaves row 1 unpaired; optimal scores 3
+        assert _best_source_assignment([[2, 1], [2, 0]]) == {0: 1, 1: 0}
+
+    def test_ties_pair_every_row(self):
+        """Test that equal scores still give a full one-to-one pairing."""
+        assignment = _best_source_assignment([[1, 1], [1, 1]])
+        assert sorted(assignment) == [0, 1]
+        assert sorted(assignment.values()) == [0, 1]
+
+    def test_equal_score_prefers_more_pairs(self):
+        """Test that an equal total prefers pairing more sources."""
+        # {0: 0} and {0: 1, 1: 0} both score 2
+        assert _best_source_assignment([[2, 1], [1, 0]]) == {0: 1, 1: 0}
+
+    def test_zero_scores_not_paired(self):
+        """Test that pairs with no identifying match are left out."""
+        assert _best_source_assignment([[0, 0], [0, 3]]) == {1: 1}
+        assert _best_source_assignment([[0]]) == {}
+
+    @pytest.mark.parametrize(
+        "score_matrix,expected",
+        [
+            ([[1, 2, 3]], {0: 2}),
+            ([[1], [2], [3]], {2: 0}),
+            ([[3, 0, 1], [2, 0, 0]], {0: 2, 1: 0}),
+            ([[3, 2], [0, 0], [2, 0]], {0: 1, 2: 0}),
+        ],
+    )
+    def test_non_square(self, score_matrix, expected):
+        """Test more actual than expected sources, and vice versa."""
+        assert _best_source_assignment(score_matrix) == expected
+
+    def test_empty(self):
+        """Test that missing sources on either side give no pairs."""
+        assert _best_source_assignment([]) == {}
+        assert _best_source_assignment([[], []]) == {}
+
+
+class TestNarrativeCache:
+    """Tests for the on-disk cache of parsed case narratives."""
+
+    def test_miss_then_hit(self, runner, tmp_path):
+        """Test that a narrative is parsed once and then read from the cache."""
+        docx_path = tmp_path / "input_narrative.docx"
+        docx_path.write_bytes(b"docx bytes")
+
+        with patch(
+            "run_extraction.DocumentLoader.load_from_file", return_value="Narrative"
+        ) as load:
+            first = runner._load_narrative(docx_path)
+            second = runner._load_narrative(docx_path)
+
+        assert first == second == "Narrative"
+        assert load.call_count == 1
+        cache_dir = runner.output_dir / "narrative_cache"
+        assert [p.suffix for p in cache_dir.iterdir()] == [".txt"]
+
+    def test_changed_document_is_reparsed(self, runner, tmp_path):
+        """Test that editing the .docx invalidates its cached text."""
+        docx_path = tmp_path / "input_narrative.docx"
+        docx_path.write_bytes(b"docx bytes")
+
+        with patch(
+            "run_extraction.DocumentLoader.load_from_file",
+            side_effect=["Old narrative", "New narrative"],
+        ):
+            runner._load_narrative(docx_path)
+            docx_path.write_bytes(b"edited docx bytes")
+            assert runner._load_narrative(docx_path) == "New narrative"
+
+    def test_failed_write_leaves_no_entry(self, runner, tmp_path):
+        """Test that an interrupted write neither leaves a partial entry nor a temp file."""
+        docx_path = tmp_path / "input_narrative.docx"
+        docx_path.write_bytes(b"docx bytes")
+
+        with (
+            patch(
+                "run_extraction.DocumentLoader.load_from_file",
+                return_value="Narrative",
+            ),
+            patch("run_extraction.os.replace", side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            runner._load_narrative(docx_path)
+
+        assert list((runner.output_dir / "narrative_cache").iterdir()) == []
+
+
+class TestNormalizeText:
+    """Tests for the punctuation-insensitive comparison form."""
+
+    def test_ignores_case_punctuation_and_spacing(self):
+        """Test that wording-only differences normalise away."""
+        assert _normalize_text("Residential property.") == _normalize_text(
+            "residential  property"
+        )
+        assert _normalize_text("Self-employed") == _normalize_text("self employed")
+
+    def test_keeps_decimal_and_thousands_separators(self):
+        """Test that "£1,200" and "£1.200" stay different amounts."""
+        assert _normalize_text("£1,200") != _normalize_text("£1.200")
+
+    def test_keeps_sign(self):
+        """Test that a negative amount does not normalise to a positive one."""
+        assert _normalize_text("-£50,000") != _normalize_text("£50,000")
+        assert _normalize_text("-50000") != _normalize_text("50000")
+
+    def test_separators_do_not_make_values_match(self, runner):
+        """Test that _values_match no longer treats swapped separators as equal."""
+        assert not runner._values_match("£1,200", "£1.200")
+        assert runner._values_match("£1,200.", "£1,200")
+
+
+class TestCompareSources:
+    """Tests for source pairing thresholds in _compare_sources."""
+
+    def test_matching_source_paired(self, runner):
+        """Test that an identifying match is a normal match."""
+        comparison = runner._compare_sources(
+            [_actual_gift("Jane Smith")], [_expected_gift("Jane Smith")]
+        )
+        assert comparison["sources_matched"] == 1
+        accuracy = comparison["field_accuracy"][0]["accuracy"]
+        assert "low_confidence_match" not in accuracy
+
+    def test_single_zero_score_source_is_low_confidence(self, runner):
+        """Test that the only source of a type is paired despite scoring 0."""
+        comparison = runner._compare_sources(
+            [_actual_gift("Jane Smith")], [_expected_gift("Robert Brown")]
+        )
+        assert comparison["sources_matched"] == 1
+        assert comparison["field_accuracy"][0]["accuracy"]["low_confidence_match"]
+
+    def test_zero_score_not_forced_among_several(self, runner):
+        """Test that a 0-score source is left unmatched when others remain."""
+        comparison = runner._compare_sources(
+            [_actual_gift("Jane Smith"), _actual_gift("Alan Jones")],
+            [_expected_gift("Robert Brown")],
+        )
+        assert comparison["sources_matched"] == 0
+        assert comparison["field_accuracy"][0]["accuracy"]["unmatched"]
+        assert comparison["sources_extra"] == ["gift"]
+
+    def test_reserved_source_not_taken_as_low_confidence(self, runner):
+        """Test that a source paired elsewhere is not reused for a 0-score row."""
+        comparison = runner._compare_sources(
+            [_actual_gift("Jane Smith")],
+            [_expected_gift("Robert Brown"), _expected_gift("Jane Smith")],
+        )
+        assert comparison["sources_matched"] == 1
+        unmatched, matched = comparison["field_accuracy"]
+        assert unmatched["accuracy"]["unmatched"]
+        assert "low_confidence_match" not in matched["accuracy"]
+
+
+class TestConcurrency:
+    """Tests for the case concurrency limit and per-case failure isolation."""
+
+    @pytest.mark.parametrize("value", ["0", "-2", "two"])
+    def test_cli_rejects_invalid_concurrency(self, value):
+        """Test that --concurrency only accepts integers of at least 1."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(value)
+
+    def test_cli_accepts_positive_concurrency(self):
+        """Test that valid limits parse as integers."""
+        assert _positive_int("3") == 3
+
+    def test_runner_rejects_zero_concurrency(self, tmp_path):
+        """Test that a zero limit fails up front instead of hanging the run."""
+        with pytest.raises(ValueError):
+            ExtractionRunner(tmp_path, max_concurrent_cases=0)
+
+    def test_unreadable_narrative_fails_only_its_case(self, runner, tmp_path):
+        """Test that a corrupt .docx is recorded as a failed case, not raised."""
+        case_dir = tmp_path / "case_99_corrupt"
+        case_dir.mkdir()
+        (case_dir / "input_narrative.docx").write_bytes(b"not a zip file")
+        runner._orchestrator = AsyncMock()
+
+        result = asyncio.run(runner.process_case(case_dir))
+
+        assert result["success"] is False
+        assert result["case_name"] == "case_99_corrupt"
+        runner._orchestrator.process.assert_not_awaited()
+
+
+class TestLLMVerdictCache:
+    """Tests for the evaluator's persistent verdict cache."""
+
+    def test_verdict_persists_across_evaluators(self, monkeypatch, tmp_path):
+        """Test that a stored verdict is read back without calling the LLM."""
+        cache_path = tmp_path / "cache.sqlite3"
+        first = _make_evaluator(monkeypatch, cache_path=cache_path)
+        written = asyncio.run(first.compare_fields("employer", "Acme", "Acme Ltd"))
+
+        second = _make_evaluator(monkeypatch, cache_path=cache_path)
+        read = asyncio.run(second.compare_fields("employer", "Acme", "Acme Ltd"))
+
+        assert read == written
+        assert read.equivalent
+        second._agent.run.assert_not_awaited()
+
+    def test_key_scoped_to_model(self, monkeypatch):
+        """Test that verdicts from one model are not reused for another."""
+        nano = _make_evaluator(monkeypatch, model="openai:gpt-4.1-nano")
+        mini = _make_evaluator(monkeypatch, model="openai:gpt-4.1-mini")
+        assert nano._cache_key("employer", "Acme", "Acme Ltd") != mini._cache_key(
+            "employer", "Acme", "Acme Ltd"
+        )
+
+    def test_key_follows_normalised_values(self, monkeypatch):
+        """Test that only case, spacing and trailing punctuation are ignored."""
+        evaluator = _make_evaluator(monkeypatch)
+        key = evaluator._cache_key("property_type", "Residential property", "House")
+
+        assert key == evaluator._cache_key(
+            "property_type", "residential  property.", "house"
+        )
+        assert key != evaluator._cache_key("property_type", "Commercial", "House")
+        assert key != evaluator._cache_key("property_type", "Residential", "Flat")
+        assert key != evaluator._cache_key("asset_type", "Residential", "House")
+
+    def test_verdict_without_reasoning_round_trips(self, monkeypatch, tmp_path):
+        """Test that reasoning-free verdicts reload intact and are re-asked on demand."""
+        cache_path = tmp_path / "cache.sqlite3"
+        first = _make_evaluator(monkeypatch, cache_path=cache_path)
+        written = asyncio.run(first.compare_fields("employer", "Acme", "Acme Ltd"))
+        output_type = first._agent.run.await_args.kwargs["output_type"]
+        assert output_type is FieldComparisonVerdict
+        assert written.reasoning == ""
+
+        reloaded = _make_evaluator(monkeypatch, cache_path=cache_path)
+        read = asyncio.run(reloaded.compare_fields("employer", "Acme", "Acme Ltd"))
+        assert read == written
+        reloaded._agent.run.assert_not_awaited()
+
+        explained = _make_evaluator(
+            monkeypatch, cache_path=cache_path, include_reasoning=True
+        )
+        result = asyncio.run(explained.compare_fields("employer", "Acme", "Acme Ltd"))
+        assert result.reasoning == "Same employer"
+        explained._agent.run.assert_awaited_once()
+
+    def test_without_cache_path_nothing_persists(self, monkeypatch):
+        """Test that evaluators without a cache file do not share verdicts."""
+        first = _make_evaluator(monkeypatch)
+        second = _make_evaluator(monkeypatch)
+
+        asyncio.run(first.compare_fields("employer", "Acme", "Acme Ltd"))
+        asyncio.run(second.compare_fields("employer", "Acme", "Acme Ltd"))
+
+        first._agent.run.assert_awaited_once()
+        second._agent.run.assert_awaited_once()
+
+    def test_fresh_cache_file_misses(self, monkeypatch, tmp_path):
+        """Test that a new cache file starts empty and records the verdict."""
+        cache_path = tmp_path / "nested" / "cache.sqlite3"
+        evaluator = _make_evaluator(monkeypatch, cache_path=cache_path)
+
+        asyncio.run(evaluator.compare_fields("employer", "Acme", "Acme Ltd"))
+
+        evaluator._agent.run.assert_awaited_once()
+        assert cache_path.exists()
+
+
+class TestCompareFieldsBatch:
+    """Tests for batching and de-duplicating LLM comparisons."""
+
+    def test_batch_evaluates_duplicates_once(self, monkeypatch):
+        """Test that repeated comparisons in a batch share one LLM call."""
+        evaluator = _make_evaluator(monkeypatch)
+        comparison = ("employer", "Acme", "Acme Ltd")
+
+        results = asyncio.run(
+            evaluator.compare_fields_batch(
+                [comparison, ("employer", "acme", "Acme Ltd."), comparison]
+            )
+        )
+
+        evaluator._agent.run.assert_awaited_once()
+        assert len(results) == 3
+        assert all(result.equivalent for result in results)
+        assert results[0] is results[1] is results[2]
+
+    def test_batch_keeps_distinct_comparisons_in_order(self, monkeypatch):
+        """Test that distinct comparisons each get their own verdict, in order."""
+        evaluator = _make_evaluator(monkeypatch)
+        verdicts = iter([True, False])
+
+        async def run(prompt, output_type):
+            return MagicMock(
+                output=output_type(
+                    equivalent=next(verdicts),
+                    actual_has_more_detail=False,
+                    expected_has_more_detail=False,
+                )
+            )
+
+        evaluator._agent.run = AsyncMock(side_effect=run)
+        results = asyncio.run(
+            evaluator.compare_fields_batch(
+                [
+                    ("employer", "Acme", "Acme Ltd"),
+                    ("job_title", "Analyst", "Director"),
+                    ("employer", "Acme", "Acme Ltd"),
+                ]
+            )
+        )
+
+        assert evaluator._agent.run.await_count == 2
+        assert [result.equivalent for result in results] == [True, False, True]
+
+
+class TestApplyLLMEvaluations:
+    """Tests for folding LLM verdicts back into a comparison."""
+
+    @staticmethod
+    def _comparison() -> dict:
+        """Helper to build a comparison with one incorrect employer field."""
+        return {
+            "sources": {
+                "field_accuracy": [
+                    {
+                        "source_type": "employment_income",
+                        "accuracy": {
+                            "total_fields": 2,
+                            "matched_fields": 1,
+                            "accuracy_rate": 0.5,
+                            "incorrect_fields": [{"field": "employer"}],
+                        },
+                    }
+                ]
+            }
+        }
+
+    @pytest.mark.parametrize(
+        ("reasoning", "expected_detail"),
+        [("", None), ("Same employer", "Same employer")],
+    )
+    def test_reasoning_only_recorded_when_given(
+        self, runner, reasoning, expected_detail
+    ):
+        """Test that details only carry reasoning when the verdict has one."""
+        comparison = self._comparison()
+        verdict = FieldComparisonResult(
+            equivalent=True,
+            actual_has_more_detail=False,
+            expected_has_more_detail=False,
+            reasoning=reasoning,
+        )
+
+        runner._apply_llm_evaluations(
+            comparison,
+            [(("employer", "Acme", "Acme Ltd", 0, "employment_income"), verdict)],
+        )
+
+        (detail,) = comparison["llm_evaluation"]["details"]
+        assert detail.get("reasoning") == expected_detail
+        accuracy = comparison["sources"]["field_accuracy"][0]["accuracy"]
+        assert accuracy["incorrect_fields"] == []
+        assert accuracy["accuracy_rate"] == 1.0
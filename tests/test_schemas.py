@@ -135,6 +135,14 @@ class TestExtractionMetadata:
         assert metadata.total_stated_net_worth == 1000000.0
         assert metadata.currency == "GBP"
 
+    def test_extracted_at_not_serialized(self):
+        """Test that the extraction timestamp stays out of the output schema."""
+        metadata = ExtractionMetadata(
+            account_holder=AccountHolder(name="John Doe", type=AccountType.INDIVIDUAL)
+        )
+        assert metadata.extracted_at is not None
+        assert "extracted_at" not in metadata.model_dump()
+
 
 class TestExtractionSummary:
     """Tests for ExtractionSummary model."""
@@ -150,6 +158,21 @@ class TestExtractionSummary:
         assert summary.total_sources_identified == 3
         assert summary.overall_completeness_score == 0.85
 
+    def test_serialized_keys_match_output_schema(self):
+        """Test that the summary exports exactly the documented fields."""
+        summary = ExtractionSummary(
+            total_sources_identified=1,
+            fully_complete_sources=1,
+            sources_with_missing_fields=0,
+            overall_completeness_score=1.0,
+        )
+        assert set(summary.model_dump()) == {
+            "total_sources_identified",
+            "fully_complete_sources",
+            "sources_with_missing_fields",
+            "overall_completeness_score",
+        }
+
 
 class TestExtractionResult:
     """Tests for ExtractionResult model."""
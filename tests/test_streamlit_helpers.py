@@ -0,0 +1,357 @@
+"""Unit tests for Streamlit UI helpers (deterministic, no LLM calls).
+
+pytest tests/test_streamlit_helpers.py -v
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.orchestrator import failed_extraction_result
+from src.loaders.document_loader import EmptyDocumentError
+from src.models.schemas import (
+    AccountHolder,
+    AccountType,
+    ExtractionMetadata,
+    ExtractionResult,
+    ExtractionSummary,
+)
+from streamlit_ui import helpers
+
+NARRATIVE = "I earned my wealth through twenty years of employment at a bank. " * 2
+
+
+def _make_result() -> ExtractionResult:
+    """Helper to build a minimal extraction result."""
+    return ExtractionResult(
+        metadata=ExtractionMetadata(  # type: ignore[call-arg]
+            account_holder=AccountHolder(  # type: ignore[call-arg]
+                name="Jane Doe", type=AccountType.INDIVIDUAL
+            )
+        ),
+        sources_of_wealth=[],
+        summary=ExtractionSummary(
+            total_sources_identified=0,
+            fully_complete_sources=0,
+            sources_with_missing_fields=0,
+            overall_completeness_score=0.0,
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """Isolate tests from the process-wide caches and orchestrator."""
+    helpers._result_cache.clear()
+    helpers._narrative_cache.clear()
+    helpers._orchestrator = None
+    yield
+    helpers._result_cache.clear()
+    helpers._narrative_cache.clear()
+    helpers._orchestrator = None
+
+
+class TestDocumentDigest:
+    """Tests for get_document_digest."""
+
+    def test_digest_is_stable(self):
+        """Test that identical bytes produce the same digest."""
+        assert helpers.get_document_digest(b"abc") == helpers.get_document_digest(
+            b"abc"
+        )
+
+    def test_digest_differs_for_different_content(self):
+        """Test that different bytes produce different digests."""
+        assert helpers.get_document_digest(b"abc") != helpers.get_document_digest(
+            b"abd"
+        )
+
+
+class TestStagedUploads:
+    """Tests for staging uploads to temporary files."""
+
+    def test_stage_and_discard(self):
+        """Test that uploads are written to disk and removed afterwards."""
+        uploaded_file = MagicMock()
+        uploaded_file.getbuffer.return_value = memoryview(b"docx bytes")
+
+        path, digest = helpers.stage_uploaded_file(uploaded_file)
+
+        assert Path(path).read_bytes() == b"docx bytes"
+        assert digest == helpers.get_document_digest(b"docx bytes")
+
+        helpers.discard_staged_file(path)
+        assert not Path(path).exists()
+        # Discarding twice is harmless
+        helpers.discard_staged_file(path)
+
+
+class TestProcessDocumentCache:
+    """Tests for content-hash memoization in process_document."""
+
+    def test_repeat_upload_skips_pipeline(self, tmp_path):
+        """Test that the same bytes only run the orchestrator once."""
+        result = _make_result()
+        orchestrator = AsyncMock()
+        orchestrator.process.return_value = result
+        doc_path = tmp_path / "doc.docx"
+        doc_path.write_bytes(b"doc")
+
+        with (
+            patch("src.agents.orchestrator.Orchestrator", return_value=orchestrator),
+            patch.object(
+                helpers.DocumentLoader, "load_from_stream", return_value=NARRATIVE
+            ),
+        ):
+            first = asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+            second = asyncio.run(helpers.process_document(str(doc_path), "b.docx"))
+
+        assert first is result
+        assert second is result
+        assert orchestrator.process.await_count == 1
+
+    def test_retry_after_failure_skips_parsing(self, tmp_path):
+        """Test that a failed extraction does not force a re-parse on retry."""
+        orchestrator = AsyncMock()
+        orchestrator.process.side_effect = [RuntimeError("LLM down"), _make_result()]
+        doc_path = tmp_path / "doc.docx"
+        doc_path.write_bytes(b"doc")
+
+        with (
+            patch("src.agents.orchestrator.Orchestrator", return_value=orchestrator),
+            patch.object(
+                helpers.DocumentLoader, "load_from_stream", return_value=NARRATIVE
+            ) as load,
+        ):
+            with pytest.raises(RuntimeError):
+                asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+            asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+
+        assert load.call_count == 1
+        assert orchestrator.process.await_count == 2
+
+    def test_failed_extraction_not_cached(self, tmp_path):
+        """Test that the orchestrator's failure placeholder is retried."""
+        result = _make_result()
+        orchestrator = AsyncMock()
+        orchestrator.process.side_effect = [failed_extraction_result(), result]
+        doc_path = tmp_path / "doc.docx"
+        doc_path.write_bytes(b"doc")
+
+        with (
+            patch("src.agents.orchestrator.Orchestrator", return_value=orchestrator),
+            patch.object(
+                helpers.DocumentLoader, "load_from_stream", return_value=NARRATIVE
+            ),
+        ):
+            first = asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+            second = asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+
+        assert first.metadata.currency == "ERROR"
+        assert second is result
+        assert orchestrator.process.await_count == 2
+
+    def test_parse_error_propagates_unwrapped(self, tmp_path):
+        """Test that loader errors surface as-is while the orchestrator is built."""
+        orchestrator = AsyncMock()
+        doc_path = tmp_path / "doc.docx"
+        doc_path.write_bytes(b"doc")
+
+        with (
+            patch(
+                "src.agents.orchestrator.Orchestrator", return_value=orchestrator
+            ) as factory,
+            patch.object(
+                helpers.DocumentLoader,
+                "load_from_stream",
+                side_effect=EmptyDocumentError("no text"),
+            ),
+        ):
+            with pytest.raises(EmptyDocumentError):
+                asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+
+        assert factory.call_count == 1
+        orchestrator.process.assert_not_awaited()
+
+    def test_progress_callback_forwarded(self, tmp_path):
+        """Test that stage updates reach the caller's callback."""
+        orchestrator = AsyncMock()
+        orchestrator.process.return_value = _make_result()
+        doc_path = tmp_path / "doc.docx"
+        doc_path.write_bytes(b"doc")
+        stages = []
+
+        with (
+            patch("src.agents.orchestrator.Orchestrator", return_value=orchestrator),
+            patch.object(
+                helpers.DocumentLoader, "load_from_stream", return_value=NARRATIVE
+            ),
+        ):
+            asyncio.run(
+                helpers.process_document(
+                    str(doc_path), "a.docx", on_progress=stages.append
+                )
+            )
+
+        assert stages == ["Parsing document structure..."]
+        orchestrator.process.assert_awaited_once_with(
+            NARRATIVE, on_progress=stages.append
+        )
+
+    def test_orchestrator_is_shared(self, tmp_path):
+        """Test that uploads reuse one orchestrator and its agents."""
+        orchestrator = AsyncMock()
+        orchestrator.process.return_value = _make_result()
+
+        with (
+            patch(
+                "src.agents.orchestrator.Orchestrator", return_value=orchestrator
+            ) as factory,
+            patch.object(
+                helpers.DocumentLoader, "load_from_stream", return_value=NARRATIVE
+            ),
+        ):
+            for i, content in enumerate([b"one", b"two"]):
+                doc_path = tmp_path / f"doc{i}.docx"
+                doc_path.write_bytes(content)
+                asyncio.run(helpers.process_document(str(doc_path), "a.docx"))
+
+        assert factory.call_count == 1
+        assert orchestrator.process.await_count == 2
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache is bounded."""
+        for i in range(helpers.RESULT_CACHE_MAX_ENTRIES + 1):
+            helpers._cache_result(str(i), _make_result())
+
+        assert len(helpers._result_cache) == helpers.RESULT_CACHE_MAX_ENTRIES
+        assert helpers._get_cached_result("0") is None
+
+
+class TestRunAsync:
+    """Tests for the persistent background event loop."""
+
+    def test_run_async_returns_result(self):
+        """Test that coroutines run to completion on the background loop."""
+
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        assert helpers.run_async(add(2, 3)) == 5
+
+    def test_submit_async_returns_future(self):
+        """Test that submit_async does not block on the coroutine."""
+
+        async def value() -> str:
+            return "done"
+
+        future = helpers.submit_async(value())
+        assert future.result(timeout=5) == "done"
+
+    def test_event_loop_is_reused(self):
+        """Test that repeated calls share a single loop."""
+        loop = helpers.get_event_loop()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert helpers.run_async(current_loop()) is loop
+        assert helpers.get_event_loop() is loop
+
+
+class TestValidateUploadedFile:
+    """Tests for validate_uploaded_file."""
+
+    @staticmethod
+    def _upload(name: str, content: bytes, size: int | None = None) -> MagicMock:
+        """Helper to build a fake Streamlit upload."""
+        uploaded_file = MagicMock()
+        uploaded_file.name = name
+        uploaded_file.size = len(content) if size is None else size
+        uploaded_file.getbuffer.return_value = memoryview(content)
+        return uploaded_file
+
+    def test_valid_docx(self):
+        """Test that a zip-signed .docx passes."""
+        assert helpers.validate_uploaded_file(
+            self._upload("narrative.docx", b"PK\x03\x04rest")
+        ) == (True, "")
+
+    def test_wrong_extension(self):
+        """Test that non-.docx files are rejected."""
+        is_valid, message = helpers.validate_uploaded_file(
+            self._upload("narrative.pdf", b"%PDF")
+        )
+        assert not is_valid
+        assert ".pdf" in message
+
+    def test_oversized_file_rejected_without_reading(self):
+        """Test that oversized files are rejected on metadata alone."""
+        uploaded_file = self._upload(
+            "narrative.docx", b"", size=helpers.MAX_FILE_SIZE_BYTES + 1
+        )
+        is_valid, _ = helpers.validate_uploaded_file(uploaded_file)
+        assert not is_valid
+        uploaded_file.getbuffer.assert_not_called()
+        uploaded_file.read.assert_not_called()
+
+    def test_bad_signature(self):
+        """Test that a renamed non-zip file is rejected."""
+        is_valid, message = helpers.validate_uploaded_file(
+            self._upload("narrative.docx", b"plain text")
+        )
+        assert not is_valid
+        assert "not a valid Word document" in message
+
+
+class TestExportToJson:
+    """Tests for export_to_json."""
+
+    def test_matches_stdlib_formatting(self):
+        """Test that export output is unchanged from the json.dumps form."""
+        result = _make_result()
+        result.metadata.account_holder.name = "Zoë Ångström"
+
+        assert helpers.export_to_json(result) == json.dumps(
+            result.model_dump(mode="json"), indent=2, ensure_ascii=False
+        )
+
+
+class TestExportFilename:
+    """Tests for get_export_filename."""
+
+    def test_uses_extraction_time(self):
+        """Test that the filename is stable for a given result."""
+        result = _make_result()
+        result.metadata.account_holder.name = "Doe, Jane"
+        result.metadata.extracted_at = datetime(2026, 1, 23, 11, 36, 32)
+
+        assert (
+            helpers.get_export_filename(result) == "sow_Doe_Jane_20260123_113632.json"
+        )
+
+
+class TestCompletenessDisplay:
+    """Tests for completeness score banding."""
+
+    @pytest.mark.parametrize(
+        "score,expected_class",
+        [
+            (0.0, "incomplete"),
+            (0.49, "incomplete"),
+            (0.5, "partial"),
+            (0.79, "partial"),
+            (0.8, "complete"),
+            (1.0, "complete"),
+        ],
+    )
+    def test_band_boundaries(self, score, expected_class):
+        """Test that scores fall into the expected band."""
+        color, status, css_class = helpers.get_completeness_display(score)
+        assert css_class == expected_class
+        assert helpers.get_completeness_color(score) == (color, status)
+        assert helpers.get_status_class(score) == css_class